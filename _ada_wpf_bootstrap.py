@@ -0,0 +1,17 @@
+# _ada_wpf_bootstrap.py — one place that loads the WPF assemblies for ada_ui
+_LOADED = False
+
+
+def ensure_wpf():
+    """Add the WPF assembly references once per process (no-op after that)."""
+    # A "System.Windows" namespace alone proves nothing: System.Windows.Forms
+    # creates it too. AddReference is idempotent, so a second copy of this
+    # module (imported via the other package path) only repeats cheap calls.
+    global _LOADED
+    if _LOADED:
+        return
+    import clr  # type: ignore
+    clr.AddReference("PresentationCore")
+    clr.AddReference("PresentationFramework")
+    clr.AddReference("WindowsBase")
+    _LOADED = True
@@ -4,132 +4,307 @@ ADa bootstrap — Option 2 (prefer Tools over Manage)
 ---------------------------------------------------
 Sets import and DLL search order so NumPy 2.x + Shapely 2.x load reliably under
 pyRevit CPython (Revit 2024+). Tools > Manage is enforced, central shared cache
-(C:/Revit/pyrevit_pkgs/cp312) is added, and any pre-existing thirdparty paths are
+(C:/Revit/pyrevit_pkgs/<tag>, e.g. cp312) is added, and any pre-existing thirdparty paths are
 removed before ours are inserted.
+
+Set ADA_BOOTSTRAP_LOG=1 to append a diagnostic snapshot to
+~/Desktop/ADa_bootstrap.log (bootstrap exceptions are always logged).
+
+Shared bytecode cache (opt-in): with ADA_SHARED_PYCACHE=1 and an existing
+C:/Revit/pyrevit_pkgs/<tag>/__pycache__, that directory becomes
+sys.pycache_prefix for modules imported after this one. The prefix is
+process-wide, so third-party packages read/write there too, and concurrent
+Revit sessions with the flag set all write into the same folder. Warm it with:
+    python ada_bootstrap.py --warm-pycache
 """
 
 from __future__ import annotations
 import os
 import sys
-import platform
+import functools
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, NamedTuple
+
+# ------------------ shared bytecode cache ------------------
+_SHARED_ROOT = r"C:\Revit\pyrevit_pkgs"
+
+def _py_tag() -> str:
+    return "cp{}{}".format(sys.version_info.major, sys.version_info.minor)  # cp312
+
+def _shared_base(tag: str) -> str:
+    return os.path.join(_SHARED_ROOT, tag)
+
+def _shared_pycache() -> str:
+    return os.path.join(_shared_base(_py_tag()), "__pycache__")
+
+def _use_shared_pycache() -> None:
+    """Point sys.pycache_prefix at the shared cache (ADA_SHARED_PYCACHE=1 and dir exists).
+
+    sys.pycache_prefix cannot be scoped to the ADa lib roots: every module
+    compiled afterwards (pyRevit, NumPy, ...) writes its .pyc there too, and
+    every Revit session with the flag set writes into the same folder.
+    """
+    try:
+        if not os.environ.get("ADA_SHARED_PYCACHE"):
+            return
+        prefix = _shared_pycache()
+        if sys.pycache_prefix is None and os.path.isdir(prefix):
+            sys.pycache_prefix = prefix
+    except Exception:
+        pass
+
+def warm_shared_pycache() -> bool:
+    """Byte-compile the ADa lib folders (not thirdparty) into the shared cache."""
+    import compileall, re
+    prefix = _shared_pycache()
+    os.makedirs(prefix, exist_ok=True)
+    p = _env_paths()
+    saved, sys.pycache_prefix = sys.pycache_prefix, prefix   # compileall writes via the prefix
+    try:
+        ok = True
+        for d in (p.tools_lib, p.manage_lib):
+            if os.path.isdir(d):
+                ok = compileall.compile_dir(d, quiet=1, rx=re.compile(r"[\\/]thirdparty[\\/]")) and ok
+        return bool(ok)
+    finally:
+        sys.pycache_prefix = saved
+
+_use_shared_pycache()
 
 # ----------------------- tiny logger -----------------------
 def _log_path() -> Path:
     return Path.home() / "Desktop" / "ADa_bootstrap.log"
 
-def _log_write(lines: Iterable[str]) -> None:
+def _log_enabled() -> bool:
+    return bool(os.environ.get("ADA_BOOTSTRAP_LOG"))
+
+def _log_write(lines: Iterable[str], force: bool = False) -> None:
+    if not (force or _log_enabled()):
+        return
     try:
         lp = _log_path()
         lp.parent.mkdir(parents=True, exist_ok=True)
         with lp.open("a", encoding="utf-8") as f:
-            for line in lines:
-                f.write(str(line).rstrip() + "\n")
+            f.write("\n".join(str(line).rstrip() for line in lines) + "\n")
     except Exception:
         pass
 
-def _log_header(title: str) -> None:
-    _log_write(["", "=" * 78, title, "=" * 78])
+def _log_header(title: str, force: bool = False) -> None:
+    _log_write(["", "=" * 78, title, "=" * 78], force=force)
 
 # --------------------- helpers -----------------------------
-def _add_first(p: Path) -> None:
-    """Prepend a path to sys.path if it exists."""
+_BOOTSTRAPPED = False
+_dir_hits: set[str] = set()   # directories seen to exist
+
+def _is_dir(s: str) -> bool:
+    """os.path.isdir() that caches hits only.
+
+    Misses are re-probed, so ensure_paths(force=True) picks up a folder that
+    appears later (NAS mount, sync finishing after Revit starts).
+    """
+    if s in _dir_hits:
+        return True
+    if os.path.isdir(s):
+        _dir_hits.add(s)
+        return True
+    return False
+
+def _stage_first(p: str, staged: list[str], seen: set[str]) -> None:
+    """Queue an existing path for the front of sys.path (see ensure_paths).
+
+    ``seen`` mirrors sys.path as a set so repeated calls avoid linear scans.
+    """
     try:
-        if p and p.is_dir():
-            s = str(p)
-            if s not in sys.path:
-                sys.path.insert(0, s)
+        if p and p not in seen and _is_dir(p):
+            staged.append(p)
+            seen.add(p)
     except Exception:
         pass
 
-def _add_dll_dir(p: Path) -> None:
-    """Add a directory to the Windows DLL search path (Py 3.8+)."""
+_ADDED_DLL_DIRS: set[str] = set()
+
+def _add_dll_dir(p: str) -> None:
+    """Add a directory to the Windows DLL search path (Py 3.8+), once per process."""
+    if not p or p in _ADDED_DLL_DIRS:
+        return
     try:
-        if hasattr(os, "add_dll_directory") and p and p.is_dir():
-            os.add_dll_directory(str(p))
+        if hasattr(os, "add_dll_directory") and _is_dir(p):
+            os.add_dll_directory(p)
+            _ADDED_DLL_DIRS.add(p)
     except Exception:
         pass
 
-# ------------------- main entry ----------------------------
-def ensure_paths() -> None:
+class _OptionalModuleMissCache:
+    """sys.meta_path recorder for failed lookups of optional ADa modules.
+
+    Installed *last* on sys.meta_path, so find_spec only runs after every other
+    finder has already missed: recording costs no extra sys.path walk, and None
+    is always returned so nothing behind it is bypassed. Probe sites (e.g. the
+    bulk editor's _has_module) ask known_missing() before probing again.
+    Misses are dropped on invalidate_caches() (ensure_paths calls it) or when
+    sys.path is replaced or changes length.
+    """
+
+    _ada_miss_cache = True
+    NAMES = frozenset(("ada_brandforms_v6", "gp_ui_shims"))
+
+    def __init__(self) -> None:
+        self._missing: set[str] = set()
+        self._path_key = (id(sys.path), len(sys.path))
+
+    def _check_path(self) -> None:
+        key = (id(sys.path), len(sys.path))
+        if key != self._path_key:
+            self._missing.clear()
+            self._path_key = key
+
+    def find_spec(self, name, path=None, target=None):
+        if path is None and name in self.NAMES:
+            self._check_path()
+            self._missing.add(name)
+        return None
+
+    def known_missing(self, name: str) -> bool:
+        self._check_path()
+        return name in self._missing
+
+    def invalidate_caches(self) -> None:
+        self._missing.clear()
+        self._path_key = (id(sys.path), len(sys.path))
+
+_MISS_CACHE = _OptionalModuleMissCache()
+
+def _install_miss_cache() -> None:
+    global _MISS_CACHE
+    for f in sys.meta_path:
+        if getattr(f, "_ada_miss_cache", False):
+            _MISS_CACHE = f   # reloaded module: keep using the installed recorder
+            return
+    sys.meta_path.append(_MISS_CACHE)
+
+def known_missing(name: str) -> bool:
+    """True if ``name`` (an optional ADa module) already failed to import on this sys.path."""
+    return _MISS_CACHE.known_missing(name)
+
+class _EnvPaths(NamedTuple):
+    tag: str
+    plat: str
+    tools_lib: str
+    manage_lib: str
+    tools_tp: str
+    manage_tp: str
+    tools_base: str
+    shared_base: str
+
+@functools.lru_cache(maxsize=1)
+def _env_paths() -> _EnvPaths:
+    """Resolve the extension/shared bases once per process (they don't change)."""
     # Detect our Python tag (e.g. cp312) and platform folder
-    tag  = "cp{}{}".format(sys.version_info.major, sys.version_info.minor)  # cp312
+    tag  = _py_tag()
     plat = "win-amd64-" + tag
 
-    # Resolve %APPDATA%\pyRevit\Extensions
-    appdata = Path(os.environ.get("APPDATA", Path.home() / "AppData/Roaming"))
-    exts    = appdata / "pyRevit" / "Extensions"
+    # Resolve %APPDATA%\pyRevit\Extensions (plain strings: cheaper than Path joins)
+    join    = os.path.join
+    appdata = os.environ.get("APPDATA") or join(str(Path.home()), "AppData", "Roaming")
+    exts    = join(appdata, "pyRevit", "Extensions")
 
-    tools_lib   = exts / "ADa-Tools.extension"  / "lib"
-    manage_lib  = exts / "ADa-Manage.extension" / "lib"
-    tools_tp    = tools_lib  / "thirdparty"
-    manage_tp   = manage_lib / "thirdparty"
-    tools_base  = tools_tp   / plat             # e.g. ...\thirdparty\win-amd64-cp312
+    tools_lib   = join(exts, "ADa-Tools.extension", "lib")
+    manage_lib  = join(exts, "ADa-Manage.extension", "lib")
+    tools_tp    = join(tools_lib, "thirdparty")
+    manage_tp   = join(manage_lib, "thirdparty")
+    tools_base  = join(tools_tp, plat)          # e.g. ...\thirdparty\win-amd64-cp312
 
     # >>> Add central shared cache (NAS/local sync)
-    shared_base = Path(r"C:\Revit\pyrevit_pkgs\cp312")
+    shared_base = _shared_base(tag)             # e.g. C:\Revit\pyrevit_pkgs\cp312
+
+    return _EnvPaths(tag, plat, tools_lib, manage_lib, tools_tp, manage_tp,
+                     tools_base, shared_base)
+
+# ------------------- main entry ----------------------------
+def ensure_paths(force: bool = False) -> None:
+    global _BOOTSTRAPPED
+    if _BOOTSTRAPPED and not force:
+        return
+
+    (tag, plat, tools_lib, manage_lib, tools_tp, manage_tp,
+     tools_base, shared_base) = _env_paths()
+    join = os.path.join
 
     # 0) Keep stray site-packages out of the way (only if not set)
     os.environ.setdefault("PYTHONNOUSERSITE", "1")
 
     # 1) Remove any existing thirdparty entries so we control ordering
-    def _starts_with_any(s: str, roots: list[Path]) -> bool:
-        s_lower = s.lower()
-        for r in roots:
-            if str(r).lower() and s_lower.startswith(str(r).lower()):
-                return True
-        return False
-
-    roots_to_strip = [
-        tools_tp, tools_tp / "common", tools_base,
-        manage_tp, manage_tp / "common", manage_tp / plat,
-        shared_base
-    ]
-    sys.path[:] = [p for p in sys.path if not _starts_with_any(p, roots_to_strip)]
+    # normcase once (case + slash direction on Windows); startswith(tuple) scans in C
+    _norm = os.path.normcase
+    roots_to_strip = tuple(
+        _norm(r) for r in (
+            tools_tp, join(tools_tp, "common"), tools_base,
+            manage_tp, join(manage_tp, "common"), join(manage_tp, plat),
+            shared_base
+        ) if r
+    )
+    sys.path[:] = [p for p in sys.path if not _norm(p).startswith(roots_to_strip)]
+    seen = set(sys.path)
 
     # 2) Insert **Tools first**, then **Manage**, then shared cache
-    _add_first(tools_tp / "common")
-    _add_first(tools_base)
-    _add_first(tools_lib)
+    # Each staged path goes in front of the previous ones (same result as a run
+    # of insert(0, p)), applied with one slice assignment instead of K shifts.
+    staged: list[str] = []
+    _stage_first(join(tools_tp, "common"), staged, seen)
+    _stage_first(tools_base, staged, seen)
+    _stage_first(tools_lib, staged, seen)
 
-    _add_first(manage_tp / "common")
-    _add_first(manage_tp / plat)
-    _add_first(manage_lib)
+    _stage_first(join(manage_tp, "common"), staged, seen)
+    _stage_first(join(manage_tp, plat), staged, seen)
+    _stage_first(manage_lib, staged, seen)
 
-    _add_first(shared_base)
+    _stage_first(shared_base, staged, seen)
 
     # 2b) Honor ADA_CORE_DIR environment variable if set
     ada_core_dir = os.environ.get("ADA_CORE_DIR")
     if ada_core_dir:
-        p = Path(ada_core_dir)
-        if p.is_dir():
-            _add_first(p)
+        _stage_first(ada_core_dir, staged, seen)
+
+    staged.reverse()
+    sys.path[:0] = staged
 
     # 3) Add DLL directories (NumPy + Shapely)
     _add_dll_dir(shared_base)
-    _add_dll_dir(shared_base / r"numpy\_core")
-    _add_dll_dir(shared_base / r"shapely\.libs")
-
-    # 4) Log snapshot
-    _log_header("ADa bootstrap (Tools > Manage > Shared + ADA_CORE_DIR)")
-    _log_write([
-        "Python: {} ({})".format(platform.python_version(), platform.architecture()[0]),
-        "Exec  : {}".format(sys.executable),
-        "Tag   : {}".format(tag),
-        "Tools lib      : {}".format(tools_lib),
-        "Manage lib     : {}".format(manage_lib),
-        "Thirdparty base: {}".format(tools_base),
-        "Shared base    : {}".format(shared_base),
-        "ADA_CORE_DIR   : {}".format(ada_core_dir or "<not set>"),
-        "",
-        "[sys.path first 20]",
-        *sys.path[:20],
-    ])
+    _add_dll_dir(join(shared_base, "numpy", "_core"))
+    _add_dll_dir(join(shared_base, "shapely", ".libs"))
+
+    # 4) Log snapshot (opt-in)
+    if _log_enabled():
+        _log_header("ADa bootstrap (Tools > Manage > Shared + ADA_CORE_DIR)")
+        _log_write([
+            "Python: {}.{}.{} ({})".format(*sys.version_info[:3],
+                                           "64bit" if sys.maxsize > 2**32 else "32bit"),
+            "Exec  : {}".format(sys.executable),
+            "Tag   : {}".format(tag),
+            "Tools lib      : {}".format(tools_lib),
+            "Manage lib     : {}".format(manage_lib),
+            "Thirdparty base: {}".format(tools_base),
+            "Shared base    : {}".format(shared_base),
+            "ADA_CORE_DIR   : {}".format(ada_core_dir or "<not set>"),
+            "",
+            "[sys.path first 20]",
+            *sys.path[:20],
+        ])
+
+    # sys.path changed: forget any optional-module misses recorded before
+    for f in sys.meta_path:
+        if getattr(f, "_ada_miss_cache", False):
+            f.invalidate_caches()
+
+    _BOOTSTRAPPED = True
+
+if __name__ == "__main__" and "--warm-pycache" in sys.argv:
+    sys.exit(0 if warm_shared_pycache() else 1)
 
 # Run once when imported
 try:
     ensure_paths()
+    _install_miss_cache()
 except Exception as e:
-    _log_header("ADa bootstrap EXCEPTION")
-    _log_write([repr(e)])
\ No newline at end of file
+    _log_header("ADa bootstrap EXCEPTION", force=True)
+    _log_write([repr(e)], force=True)
\ No newline at end of file
@@ -16,27 +16,52 @@
 #   'name', 'display_name', 'type' in {'bool','float','string'}, 'value', 'config' (optional: {'unit','notes'})
 # Returns dict {param_name: new_value} or None if cancelled.
 
-def _load_forms():
+import bisect
+import importlib
+import importlib.util
+import inspect
+import sys
+
+# (module, attribute) candidates for the forms backend, in preference order;
+# attribute None means the module itself is the forms object.
+_FORMS_CANDIDATES = (
+    ("ada_brandforms_v6", "forms"),
+    ("ada_bootstrap", "forms"),
+    ("pyrevit.forms", None),
+)
+
+def _has_module(name):
+    # A module ada_bootstrap already saw fail on this sys.path is not probed again
+    boot = sys.modules.get("ada_bootstrap")
+    if boot is not None and getattr(boot, "known_missing", None) and boot.known_missing(name):
+        return False
     try:
-        from ada_brandforms_v6 import forms as _forms  # type: ignore
-        forms = _forms
-    except Exception:
+        return importlib.util.find_spec(name) is not None
+    except Exception:  # missing parent package, broken __spec__, ...
+        return False
+
+class _Fallback(object):
+    def alert(self, msg, title="Message"):
+        print("[ALERT]", title, msg)
+    def SelectFromList(self, items=None, **kwargs):
+        return None
+    def ask_for_string(self, *args, **kwargs):
+        return None
+
+def _load_forms():
+    forms = None
+    for mod_name, attr in _FORMS_CANDIDATES:
+        # cheap existence check first; only modules that are present get imported
+        if not _has_module(mod_name):
+            continue
         try:
-            from ada_bootstrap import forms as _forms  # type: ignore
-            forms = _forms
+            mod = importlib.import_module(mod_name)
+            forms = getattr(mod, attr) if attr else mod
+            break
         except Exception:
-            try:
-                from pyrevit import forms as _forms  # type: ignore
-                forms = _forms
-            except Exception:
-                class _Fallback(object):
-                    def alert(self, msg, title="Message"):
-                        print("[ALERT]", title, msg)
-                    def SelectFromList(self, items=None, **kwargs):
-                        return None
-                    def ask_for_string(self, *args, **kwargs):
-                        return None
-                forms = _Fallback()
+            continue
+    if forms is None:
+        forms = _Fallback()
     try:
         # If gp_ui_shims is available, install it so yes/no etc. work
         from gp_ui_shims import install_ui_shims
@@ -45,10 +70,24 @@ def _load_forms():
         pass
     return forms
 
-FORMS = _load_forms()
+_FORMS = None
+
+def _get_forms():
+    """Resolve the forms backend on first use rather than at import time."""
+    global _FORMS
+    if _FORMS is None:
+        _FORMS = _load_forms()
+    return _FORMS
+
+def __getattr__(name):
+    # Keep `ada_brand_bulk_editor_shim.FORMS` working without eager loading (PEP 562)
+    if name == "FORMS":
+        return _get_forms()
+    raise AttributeError(name)
 
 def _sfl(items, **kwargs):
-    sfl = getattr(FORMS, "SelectFromList", None) or getattr(FORMS, "select_from_list", None)
+    forms = _get_forms()
+    sfl = getattr(forms, "SelectFromList", None) or getattr(forms, "select_from_list", None)
     if sfl is not None and hasattr(sfl, "show"):
         try:
             return sfl.show(items, **kwargs)
@@ -59,20 +98,63 @@ def _sfl(items, **kwargs):
     except Exception:
         return None
 
-def _ask(prompt, title="Input", default=""):
+def _ask_by_trial(f, prompt, title, default):
+    # Signature not introspectable (.NET/builtin): probe the call forms in order
+    try:
+        return f(prompt=prompt, title=title, default=default)
+    except TypeError:
+        try:
+            return f(prompt, default, title)
+        except TypeError:
+            return f(prompt)
+
+# Call forms tried for a string prompt, in order: keywords, (prompt, default, title), (prompt)
+_ASK_SHAPES = (
+    ("kw",   (), {"prompt": "", "title": "", "default": ""}),
+    ("pos3", ("", "", ""), {}),
+    ("pos1", ("",), {}),
+)
+
+def _ask_call_shape(sig):
+    """First call form that ``sig`` binds, or None."""
+    for shape, args, kwargs in _ASK_SHAPES:
+        try:
+            sig.bind(*args, **kwargs)
+        except TypeError:
+            continue
+        return shape
+    return None
+
+def _make_ask_thunk(forms):
+    """Pick the backend's string prompt and how to call it, from its signature."""
     for name in ("ask_for_string", "ask_string", "AskForString"):
-        f = getattr(FORMS, name, None)
-        if callable(f):
-            try:
-                return f(prompt=prompt, title=title, default=default)
-            except TypeError:
-                try:
-                    return f(prompt, default, title)
-                except TypeError:
-                    try:
-                        return f(prompt)
-                    except TypeError:
-                        pass
+        f = getattr(forms, name, None)
+        if not callable(f):
+            continue
+        try:
+            sig = inspect.signature(f)
+        except (TypeError, ValueError):
+            return lambda p, t, d, f=f: _ask_by_trial(f, p, t, d)
+        shape = _ask_call_shape(sig)
+        if shape == "kw":
+            return lambda p, t, d, f=f: f(prompt=p, title=t, default=d)
+        if shape == "pos3":
+            return lambda p, t, d, f=f: f(p, d, t)
+        if shape == "pos1":
+            return lambda p, t, d, f=f: f(p)
+        # no call form fits this one; try the next name
+    return None
+
+_ASK_THUNK = None
+
+def _ask(prompt, title="Input", default=""):
+    global _ASK_THUNK
+    if _ASK_THUNK is None:
+        _ASK_THUNK = _make_ask_thunk(_get_forms()) or False
+    if _ASK_THUNK:
+        # The call form was validated up front, so a TypeError here comes from
+        # inside the backend and is not swallowed
+        return _ASK_THUNK(prompt, title, default)
     try:
         print("[INPUT]", title, prompt)
     except Exception:
@@ -92,6 +174,9 @@ def _fmt_current(v, ptype, unit):
         return s + ((" " + unit) if unit else "")
     return str(v)
 
+_BOOL_TRUE = frozenset(("yes", "true", "1", "y", "t", "✓", "check", "tick"))
+_BOOL_FALSE = frozenset(("no", "false", "0", "n", "f", "✗", "cross", "x"))
+
 def _parse_value(ptype, unit, raw, keep_token=""):
     if raw is None:
         return keep_token
@@ -99,9 +184,10 @@ def _parse_value(ptype, unit, raw, keep_token=""):
     if txt == "":
         return keep_token
     if ptype == "bool":
-        if txt.lower() in ("yes","true","1","y","t","✓","check","tick"):
+        t = txt.lower()
+        if t in _BOOL_TRUE:
             return True
-        if txt.lower() in ("no","false","0","n","f","✗","cross","x"):
+        if t in _BOOL_FALSE:
             return False
         return keep_token
     if ptype == "float":
@@ -112,6 +198,18 @@ def _parse_value(ptype, unit, raw, keep_token=""):
             return keep_token
     return txt
 
+_MENU_HEAD = ("Apply / Done", "Cancel", "—")  # actions + separator above the rows
+
+def _render_row(r):
+    cur = _fmt_current(r["cur"], r["ptype"], r["unit"])
+    if r["new"] is None:
+        ndisp = "(keep)"
+    else:
+        ndisp = _fmt_current(r["new"], r["ptype"], r["unit"])
+    return "• {disp:<30}  current: {cur:<10}  new: {new}".format(
+        disp=r["display"], cur=cur, new=ndisp
+    )
+
 def bulk_edit(editable_params, title="Edit Parameters (ADa)"):
     """
     ADa-themed iterative editor using SelectFromList + ask_for_string.
@@ -133,24 +231,16 @@ def bulk_edit(editable_params, title="Edit Parameters (ADa)"):
             "new": None  # sentinel for "no change"
         })
 
-    def make_menu():
-        menu = []
-        menu.append("Apply / Done")
-        menu.append("Cancel")
-        menu.append("—")  # separator
-        for r in rows:
-            cur = _fmt_current(r["cur"], r["ptype"], r["unit"])
-            if r["new"] is None:
-                ndisp = "(keep)"
-            else:
-                ndisp = _fmt_current(r["new"], r["ptype"], r["unit"])
-            menu.append("• {disp:<30}  current: {cur:<10}  new: {new}".format(
-                disp=r["display"], cur=cur, new=ndisp
-            ))
-        return menu
+    # Rendered once; only the row that was just edited is re-rendered per loop
+    labels = [_render_row(r) for r in rows]
+    items = list(_MENU_HEAD) + labels
+    # label -> ascending row indices; identical labels resolve to the first row,
+    # and the next one takes over once that row's label changes
+    label_to_rows = {}
+    for i, lab in enumerate(labels):
+        label_to_rows.setdefault(lab, []).append(i)
 
     while True:
-        items = make_menu()
         sel = _sfl(items, title=title, multiselect=False, width=780, height=560, button_name="Select")
         if not sel:
             return None
@@ -166,12 +256,10 @@ def bulk_edit(editable_params, title="Edit Parameters (ADa)"):
             continue
 
         # Which row?
-        try:
-            idx = items.index(sel) - 3  # subtract header + 2 actions + separator
-            if idx < 0 or idx >= len(rows):
-                continue
-        except Exception:
+        idxs = label_to_rows.get(sel)
+        if not idxs:
             continue
+        idx = idxs[0]
 
         r = rows[idx]
         ptype = r["ptype"]
@@ -194,6 +282,14 @@ def bulk_edit(editable_params, title="Edit Parameters (ADa)"):
             raw = _ask(prompt=prompt, title=title, default=default)
             value = _parse_value(ptype, unit, raw, keep_token=None)
             r["new"] = value
+        pos = len(_MENU_HEAD) + idx
+        old_label, new_label = items[pos], _render_row(r)
+        if new_label != old_label:
+            idxs.remove(idx)
+            if not idxs:
+                del label_to_rows[old_label]
+            bisect.insort(label_to_rows.setdefault(new_label, []), idx)
+            items[pos] = new_label
 
     # unreachable
     return None
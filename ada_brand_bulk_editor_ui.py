@@ -2,22 +2,104 @@
 # ADa-themed bulk editor (dark + gradient header, BORDERLESS + ROUNDED CORNERS).
 # Returns {param_name: new_value} on OK, or None on Cancel.
 
+# -------------------- value formatting / parsing --------------------------
+# Per-type dispatch tables: ptype is resolved with one dict lookup per value.
+_BOOL_TRUE  = frozenset(("yes", "true", "1", "y", "t", "✓", "tick", "check"))
+_BOOL_FALSE = frozenset(("no", "false", "0", "n", "f", "✗", "x", "cross"))
+
+def _num_text(vv):
+    # whole numbers without a trailing ".0", everything else compact
+    return "%.0f" % vv if vv.is_integer() else "%g" % vv
+
+def _safe_text(val):
+    if val is None:
+        return ""
+    if isinstance(val, float):
+        return _num_text(val)
+    try:
+        return str(val)
+    except Exception:
+        return ""
+
+def _fmt_bool(v, unit):
+    return "Yes" if bool(v) else "No"
+
+def _fmt_float(v, unit):
+    if isinstance(v, float):
+        s = _num_text(v)
+    else:
+        try:
+            s = _num_text(float(v))
+        except Exception:
+            s = str(v)
+    return s + ((" " + unit) if unit else "")
+
+def _fmt_string(v, unit):
+    return str(v)
+
+_FMTS = {"bool": _fmt_bool, "float": _fmt_float}
+
+def _fmt_current(v, ptype, unit):
+    if v is None:
+        return ""
+    return _FMTS.get(ptype, _fmt_string)(v, unit)
+
+def _parse_bool(txt):
+    tl = txt.lower()
+    if tl in _BOOL_TRUE:  return True
+    if tl in _BOOL_FALSE: return False
+    return None
+
+def _parse_float(txt):
+    try:
+        return float(txt.replace(",", ".").split()[0])
+    except Exception:
+        return None
+
+def _parse_string(txt):
+    return txt
+
+_PARSERS = {"bool": _parse_bool, "float": _parse_float}
+
+def _parse_value(ptype, unit, raw):
+    if raw is None:
+        return None
+    txt = str(raw).strip()
+    if txt == "":
+        return None
+    return _PARSERS.get(ptype, _parse_string)(txt)
+# --------------------------------------------------------------------------
+
+# clr.AddReference is the costly part of the WinForms setup; do it once per
+# process. The from-imports in bulk_edit are then plain sys.modules hits.
+_CLR_REFS = ("System", "System.Windows.Forms", "System.Drawing")
+_clr_refs_loaded = False
+
+def _ensure_clr_refs():
+    global _clr_refs_loaded
+    if not _clr_refs_loaded:
+        import clr
+        for ref in _CLR_REFS:
+            clr.AddReference(ref)
+        _clr_refs_loaded = True
+
+
 def bulk_edit(editable_params, title="Edit Parameters (Bulk)"):
     if not editable_params:
         return None
 
-    import clr
-    clr.AddReference("System")
-    clr.AddReference("System.Windows.Forms")
-    clr.AddReference("System.Drawing")
+    _ensure_clr_refs()
 
     # WinForms
     from System.Windows.Forms import (  # type: ignore
         Form, TableLayoutPanel, Label, TextBox, CheckBox, Button,
         FormBorderStyle, FormBorderStyle as _FBS, AnchorStyles, DockStyle, Padding,
         DialogResult, CheckState, FormStartPosition, FlatStyle, BorderStyle,
-        MouseButtons, Control
+        MouseButtons, Timer, RowStyle, ColumnStyle, SizeType,
+        DataGridView, DataGridViewAutoSizeColumnsMode, ControlStyles
     )
+    from System import Array, Object  # type: ignore
+    from System.Reflection import BindingFlags  # type: ignore
     # Drawing
     from System.Drawing import (  # type: ignore
         Size, Font, FontStyle, ContentAlignment, Color,
@@ -42,55 +124,28 @@ def bulk_edit(editable_params, title="Edit Parameters (Bulk)"):
     GRAD_LEFT      = Color.FromArgb(108, 99, 255)   # blue/violet
     GRAD_RIGHT     = Color.FromArgb(255, 99, 164)   # pink
     HEADER_H       = 72
+    GRID_THRESHOLD = 50                       # above this, rows go into one DataGridView
     # ---------------------------------------------------------------------
 
-    # -------------------- helpers ----------------------------------------
-    def _safe_text(val):
-        if val is None:
-            return ""
+    # Shared fonts: one GDI handle each, disposed after the form itself
+    HDR_FONT   = Font("Segoe UI", 9.5, FontStyle.Bold)
+    CLOSE_FONT = Font("Segoe UI", 11.0, FontStyle.Bold)
+
+    # Control.SetStyle is protected; reach it via reflection for double buffering
+    def _double_buffer(ctrl):
         try:
-            if isinstance(val, float):
-                return ("{:.0f}".format(val) if float(val).is_integer() else "{:g}".format(val))
-            return str(val)
+            styles = (ControlStyles.OptimizedDoubleBuffer |
+                      ControlStyles.AllPaintingInWmPaint |
+                      ControlStyles.UserPaint)
+            m = ctrl.GetType().GetMethod("SetStyle", BindingFlags.NonPublic | BindingFlags.Instance)
+            m.Invoke(ctrl, Array[Object]([styles, True]))
         except Exception:
-            return ""
-
-    def _fmt_current(v, ptype, unit):
-        if v is None:
-            return ""
-        if ptype == "bool":
-            return "Yes" if bool(v) else "No"
-        if ptype == "float":
-            try:
-                vv = float(v)
-                s = "{:.0f}".format(vv) if vv.is_integer() else "{:g}".format(vv)
-            except Exception:
-                s = str(v)
-            return s + ((" " + unit) if unit else "")
-        return str(v)
-
-    def _parse_value(ptype, unit, raw):
-        if raw is None:
-            return None
-        txt = str(raw).strip()
-        if txt == "":
-            return None
-        if ptype == "bool":
-            tl = txt.lower()
-            if tl in ("yes", "true", "1", "y", "t", "✓", "tick", "check"):  return True
-            if tl in ("no", "false", "0", "n", "f", "✗", "x", "cross"):    return False
-            return None
-        if ptype == "float":
-            try:
-                return float(txt.replace(",", ".").split()[0])
-            except Exception:
-                return None
-        return txt
-    # ---------------------------------------------------------------------
+            pass
 
     # -------------------- window -----------------------------------------
     form = Form()
     form.Text = title
+    _double_buffer(form)
 
     # Robust handling for FormBorderStyle.None (avoid name collision with Python None)
     FBS = _FBS
@@ -109,12 +164,26 @@ def bulk_edit(editable_params, title="Edit Parameters (Bulk)"):
     form.Padding = Padding(16, HEADER_H + 12, 16, 16)
 
     # --- rounded window corners ------------------------------------------
+    # Region is rebuilt only when the size changes; the previous one is disposed.
+    _rgn_cache = {"key": None, "region": None}
+
+    def _dispose_region():
+        old = _rgn_cache["region"]
+        _rgn_cache["region"] = None
+        if old is not None:
+            old.Dispose()
+
     def _apply_rounded_region():
         r = int(CORNER_RADIUS)
         if r <= 0:
             form.Region = None
+            _dispose_region()
+            _rgn_cache["key"] = None
             return
         w, h = form.Width, form.Height
+        key = (w, h, r)
+        if key == _rgn_cache["key"]:
+            return
         d = 2 * r
         path = GraphicsPath()
         # top-left, top-right, bottom-right, bottom-left arcs
@@ -123,37 +192,98 @@ def bulk_edit(editable_params, title="Edit Parameters (Bulk)"):
         path.AddArc(w - d - 1,    h - d - 1,    d, d,   0, 90)
         path.AddArc(0,            h - d - 1,    d, d,  90, 90)
         path.CloseAllFigures()
-        form.Region = Region(path)
+        rgn = Region(path)
         path.Dispose()
+        form.Region = rgn
+        _dispose_region()
+        _rgn_cache["region"] = rgn
+        _rgn_cache["key"] = key
+
+    form.FormClosed += (lambda s, ev: _dispose_region())
 
     # --- window dragging via header --------------------------------------
-    _drag = {"on": False, "sx": 0, "sy": 0, "ox": 0, "oy": 0}
+    # [on, grab_x, grab_y] — indexed, not keyed: hot path. The grab point is
+    # relative to the control under the mouse, which moves with the form, so
+    # e.X/e.Y give the delta without a GetCursorPos call per move.
+    _drag = [False, 0, 0]
+    _LEFT = MouseButtons.Left
     def _md(sender, e):
-        if e.Button == MouseButtons.Left and e.Y <= HEADER_H:
-            p = Control.MousePosition
-            _drag.update(on=True, sx=p.X, sy=p.Y, ox=form.Location.X, oy=form.Location.Y)
+        if e.Button == _LEFT and e.Y <= HEADER_H:
+            _drag[:] = [True, e.X, e.Y]
     def _mm(sender, e):
-        if _drag["on"]:
-            p = Control.MousePosition
-            form.Location = Point(_drag["ox"] + (p.X - _drag["sx"]), _drag["oy"] + (p.Y - _drag["sy"]))
+        if _drag[0]:
+            dx = e.X - _drag[1]
+            dy = e.Y - _drag[2]
+            if dx or dy:
+                form.Location = Point(form.Left + dx, form.Top + dy)
     def _mu(sender, e):
-        _drag["on"] = False
-    form.MouseDown += _md
-    form.MouseMove += _mm
-    form.MouseUp   += _mu
+        _drag[0] = False
+    def _attach_drag(ctrl):
+        ctrl.MouseDown += _md
+        ctrl.MouseMove += _mm
+        ctrl.MouseUp   += _mu
+    _attach_drag(form)
 
     # --- paint header + title --------------------------------------------
+    # GDI+ objects live for the dialog; the gradient is rebuilt only on width change.
+    _hdr_gdi = {
+        "font":  Font("Segoe UI", 13.0, FontStyle.Bold),
+        "pen":   Pen(Color.FromArgb(60, 60, 60)),
+        "brush": None,
+        "w":     -1,
+    }
+
+    def _header_brush(rect):
+        if _hdr_gdi["w"] != rect.Width:
+            if _hdr_gdi["brush"] is not None:
+                _hdr_gdi["brush"].Dispose()
+            _hdr_gdi["brush"] = LinearGradientBrush(rect, GRAD_LEFT, GRAD_RIGHT, LinearGradientMode.Horizontal)
+            _hdr_gdi["w"] = rect.Width
+        return _hdr_gdi["brush"]
+
+    def _dispose_header_gdi():
+        for k in ("font", "pen", "brush"):
+            obj = _hdr_gdi[k]
+            _hdr_gdi[k] = None
+            if obj is not None:
+                obj.Dispose()
+
     def _paint_header(sender, e):
-        rect = Rectangle(0, 0, form.ClientSize.Width, HEADER_H)
-        grad = LinearGradientBrush(rect, GRAD_LEFT, GRAD_RIGHT, LinearGradientMode.Horizontal)
-        e.Graphics.FillRectangle(grad, rect); grad.Dispose()
-        e.Graphics.DrawString(title, Font("Segoe UI", 13.0, FontStyle.Bold), Brushes.White, PointF(16.0, 18.0))
-        pen = Pen(Color.FromArgb(60, 60, 60))
-        e.Graphics.DrawLine(pen, 0, HEADER_H - 1, form.ClientSize.Width, HEADER_H - 1); pen.Dispose()
+        w = form.ClientSize.Width
+        rect = Rectangle(0, 0, w, HEADER_H)
+        e.Graphics.FillRectangle(_header_brush(rect), rect)
+        e.Graphics.DrawString(title, _hdr_gdi["font"], Brushes.White, PointF(16.0, 18.0))
+        e.Graphics.DrawLine(_hdr_gdi["pen"], 0, HEADER_H - 1, w, HEADER_H - 1)
+
+    # Resize can fire dozens of times a second; coalesce region/header work
+    # onto a ~60 fps timer tick instead of doing it per WM_SIZE.
+    _resize_timer = Timer()
+    _resize_timer.Interval = 16
+    _resize_dirty = [False]
+    _last_client_w = [-1]
+
+    def _on_resize(s, ev):
+        _resize_dirty[0] = True
+        _resize_timer.Start()
+
+    def _on_resize_tick(s, ev):
+        _resize_timer.Stop()
+        if _resize_dirty[0]:
+            _resize_dirty[0] = False
+            _apply_rounded_region()
+            # The gradient spans the full width, so any width change repaints the
+            # whole band; height-only resizes leave the header untouched.
+            w = form.ClientSize.Width
+            if w != _last_client_w[0]:
+                _last_client_w[0] = w
+                form.Invalidate(Rectangle(0, 0, w, HEADER_H))
+
+    _resize_timer.Tick += _on_resize_tick
+    form.FormClosed += (lambda s, ev: (_resize_timer.Stop(), _resize_timer.Dispose()))
 
     form.Paint  += _paint_header
-    form.Resize += (lambda s, ev: (_apply_rounded_region(),
-                                   form.Invalidate(Rectangle(0, 0, form.ClientSize.Width, HEADER_H))))
+    form.FormClosed += (lambda s, ev: _dispose_header_gdi())
+    form.Resize += _on_resize
     form.Shown  += (lambda s, ev: _apply_rounded_region())
 
     # --- close “✕” (transparent label so gradient shows through) ----------
@@ -161,7 +291,7 @@ def bulk_edit(editable_params, title="Edit Parameters (Bulk)"):
     lbl_close.Text = u"✕"
     lbl_close.AutoSize = False
     lbl_close.TextAlign = ContentAlignment.MiddleCenter
-    lbl_close.Font = Font("Segoe UI", 11.0, FontStyle.Bold)
+    lbl_close.Font = CLOSE_FONT
     lbl_close.ForeColor = Color.White
     lbl_close.BackColor = Color.Transparent
     lbl_close.Size = Size(36, 28)
@@ -179,9 +309,7 @@ def bulk_edit(editable_params, title="Edit Parameters (Bulk)"):
     lbl_close.MouseLeave += _leave
     lbl_close.Click      += _click
     # allow drag from the close label area too
-    lbl_close.MouseDown += _md
-    lbl_close.MouseMove += _mm
-    lbl_close.MouseUp   += _mu
+    _attach_drag(lbl_close)
     form.Controls.Add(lbl_close)
     form.Resize += (lambda s, e: _locate_close())
     # ---------------------------------------------------------------------
@@ -191,88 +319,185 @@ def bulk_edit(editable_params, title="Edit Parameters (Bulk)"):
     table.Dock = DockStyle.Fill
     table.Padding = Padding(16, 12, 16, 16)
     table.AutoScroll = True
-    table.ColumnCount = 4
-    table.RowCount = 1
     table.BackColor = DARK_BG
+    _double_buffer(table)
+
+    # Size the grid up front (header + one row per param + buttons) so adding
+    # controls never has to grow the row collection.
+    # Large sets use a single virtual-mode DataGridView instead (one control;
+    # cell values are pulled from Python lists on paint), so the table holds
+    # just grid + buttons.
+    editable_params = list(editable_params)
+    use_grid = len(editable_params) > GRID_THRESHOLD
+    table.ColumnCount = 4
+    table.RowCount = 2 if use_grid else len(editable_params) + 2
+    table.AutoScroll = not use_grid
+    for _ in range(table.ColumnCount):
+        if use_grid:   # grid spans all four columns and should fill the width
+            table.ColumnStyles.Add(ColumnStyle(SizeType.Percent, 25.0))
+        else:
+            table.ColumnStyles.Add(ColumnStyle(SizeType.AutoSize))
+    for i in range(table.RowCount):
+        if use_grid and i == 0:
+            table.RowStyles.Add(RowStyle(SizeType.Percent, 100.0))
+        else:
+            table.RowStyles.Add(RowStyle(SizeType.AutoSize))
+
+    # No layout passes while the rows are built; one PerformLayout at the end.
+    form.SuspendLayout()
+    table.SuspendLayout()
+
+    editors = []  # (kind, name, control-or-cell, ptype)
+    _dirty_rows = set()  # editor indexes the user touched; only these are read back
 
-    def _hdr(text):
-        lbl = Label()
-        lbl.Text = text
-        lbl.Font = Font("Segoe UI", 9.5, FontStyle.Bold)
-        lbl.AutoSize = True
-        lbl.TextAlign = ContentAlignment.MiddleLeft
-        lbl.ForeColor = DARK_TEXT
-        lbl.BackColor = DARK_BG
-        return lbl
-
-    table.Controls.Add(_hdr("Parameter"), 0, 0)
-    table.Controls.Add(_hdr("Current"),   1, 0)
-    table.Controls.Add(_hdr("New Value"), 2, 0)
-    table.Controls.Add(_hdr("Unit"),      3, 0)
-
-    editors = []  # (kind, name, control, ptype)
-    row = 1
-    for p in editable_params:
-        name    = p["name"]
-        display = p.get("display_name", name)
-        ptype   = p.get("type", "string")
-        current = p.get("value")
-        cfg     = p.get("config", {}) or {}
-        unit    = cfg.get("unit", "") or ""
-
-        name_lbl = Label()
-        name_lbl.Text = _safe_text(display)
-        name_lbl.AutoSize = True
-        name_lbl.TextAlign = ContentAlignment.MiddleLeft
-        name_lbl.ForeColor = DARK_TEXT
-        name_lbl.BackColor = DARK_BG
-        table.Controls.Add(name_lbl, 0, row)
-
-        current_lbl = Label()
-        current_lbl.Text = _fmt_current(current, ptype, unit)
-        current_lbl.AutoSize = True
-        current_lbl.TextAlign = ContentAlignment.MiddleLeft
-        current_lbl.ForeColor = MUTED_TEXT
-        current_lbl.BackColor = DARK_BG
-        table.Controls.Add(current_lbl, 1, row)
-
-        if ptype == "bool":
-            cb = CheckBox()
-            cb.ThreeState = True
-            cb.CheckState = CheckState.Indeterminate
-            cb.Text = "(tick = Yes, untick = No; dash = keep)"
-            cb.AutoSize = True
-            cb.ForeColor = DARK_TEXT
-            cb.BackColor = DARK_BG
-            table.Controls.Add(cb, 2, row)
-
-            unit_lbl = Label()
-            unit_lbl.Text = ""
-            unit_lbl.AutoSize = True
-            unit_lbl.ForeColor = MUTED_TEXT
-            unit_lbl.BackColor = DARK_BG
-            table.Controls.Add(unit_lbl, 3, row)
-
-            editors.append(("bool", name, cb, ptype))
+    def _mark_dirty(ctrl, idx):
+        handler = (lambda s, ev: _dirty_rows.add(idx))
+        if isinstance(ctrl, CheckBox):
+            ctrl.CheckStateChanged += handler
         else:
-            tb = TextBox()
-            tb.Width = 310
-            tb.Text = ""
-            tb.BackColor = DARK_PANEL
-            tb.ForeColor = DARK_TEXT
-            tb.BorderStyle = BorderStyle.FixedSingle
-            table.Controls.Add(tb, 2, row)
-
-            unit_lbl = Label()
-            unit_lbl.Text = unit
-            unit_lbl.AutoSize = True
-            unit_lbl.ForeColor = MUTED_TEXT
-            unit_lbl.BackColor = DARK_BG
-            table.Controls.Add(unit_lbl, 3, row)
-
-            editors.append(("text", name, tb, ptype))
-
-        row += 1
+            ctrl.TextChanged += handler
+
+    grid = None
+    _grid_new = {}   # grid mode: row index -> text typed into "New Value"
+    if use_grid:
+        grid = DataGridView()
+        grid.Dock = DockStyle.Fill
+        grid.AllowUserToAddRows = False
+        grid.AllowUserToDeleteRows = False
+        grid.AllowUserToResizeRows = False
+        grid.RowHeadersVisible = False
+        # Fixed widths: no column re-measures every cell after each edit
+        grid.AutoSizeColumnsMode = getattr(DataGridViewAutoSizeColumnsMode, "None")
+        grid.BackgroundColor = DARK_BG
+        grid.BorderStyle = getattr(BorderStyle, "None")
+        grid.GridColor = BORDER_CLR
+        grid.EnableHeadersVisualStyles = False
+        grid.ColumnHeadersDefaultCellStyle.BackColor = DARK_BG
+        grid.ColumnHeadersDefaultCellStyle.ForeColor = DARK_TEXT
+        grid.ColumnHeadersDefaultCellStyle.Font = HDR_FONT
+        grid.DefaultCellStyle.BackColor = DARK_BG
+        grid.DefaultCellStyle.ForeColor = DARK_TEXT
+        for i, (text, width) in enumerate((("Parameter", 300), ("Current", 160),
+                                           ("New Value", 220), ("Unit", 80))):
+            grid.Columns.Add("c{}".format(i), text)
+            grid.Columns[i].Width = width
+        for i in (0, 1, 3):
+            grid.Columns[i].ReadOnly = True
+        grid.Columns[1].DefaultCellStyle.ForeColor = MUTED_TEXT
+        grid.Columns[3].DefaultCellStyle.ForeColor = MUTED_TEXT
+        grid.Columns[2].DefaultCellStyle.BackColor = DARK_PANEL
+        # One text column for every row: flags take Yes/No text (parsed by
+        # _parse_value) instead of three-state checkbox cells mixed into it
+        grid.Columns[2].ToolTipText = "Yes/No for flags; leave blank to keep"
+
+        # One (name, current, -, unit) tuple per row; the grid stores no cell values
+        grid_rows = []
+        for p in editable_params:
+            name    = p["name"]
+            ptype   = p.get("type", "string")
+            cfg     = p.get("config", {}) or {}
+            unit    = "" if ptype == "bool" else (cfg.get("unit", "") or "")
+            grid_rows.append((_safe_text(p.get("display_name", name)),
+                              _fmt_current(p.get("value"), ptype, unit), None, unit))
+            editors.append(("text", name, None, ptype))
+
+        def _cell_needed(s, ev):
+            c, r = ev.ColumnIndex, ev.RowIndex
+            ev.Value = _grid_new.get(r, "") if c == 2 else grid_rows[r][c]
+
+        def _cell_pushed(s, ev):
+            if ev.ColumnIndex == 2:
+                _grid_new[ev.RowIndex] = _safe_text(ev.Value)
+                _dirty_rows.add(ev.RowIndex)
+
+        grid.VirtualMode = True
+        grid.CellValueNeeded += _cell_needed
+        grid.CellValuePushed += _cell_pushed
+        grid.RowCount = len(grid_rows)
+
+        table.Controls.Add(grid, 0, 0)
+        table.SetColumnSpan(grid, 4)
+        row = 1
+    else:
+        def _hdr(text):
+            lbl = Label()
+            lbl.Text = text
+            lbl.Font = HDR_FONT
+            lbl.AutoSize = True
+            lbl.TextAlign = ContentAlignment.MiddleLeft
+            lbl.ForeColor = DARK_TEXT
+            lbl.BackColor = DARK_BG
+            return lbl
+
+        table.Controls.Add(_hdr("Parameter"), 0, 0)
+        table.Controls.Add(_hdr("Current"),   1, 0)
+        table.Controls.Add(_hdr("New Value"), 2, 0)
+        table.Controls.Add(_hdr("Unit"),      3, 0)
+
+        row = 1
+        for p in editable_params:
+            name    = p["name"]
+            display = p.get("display_name", name)
+            ptype   = p.get("type", "string")
+            current = p.get("value")
+            cfg     = p.get("config", {}) or {}
+            unit    = cfg.get("unit", "") or ""
+
+            name_lbl = Label()
+            name_lbl.Text = _safe_text(display)
+            name_lbl.AutoSize = True
+            name_lbl.TextAlign = ContentAlignment.MiddleLeft
+            name_lbl.ForeColor = DARK_TEXT
+            name_lbl.BackColor = DARK_BG
+            table.Controls.Add(name_lbl, 0, row)
+
+            current_lbl = Label()
+            current_lbl.Text = _fmt_current(current, ptype, unit)
+            current_lbl.AutoSize = True
+            current_lbl.TextAlign = ContentAlignment.MiddleLeft
+            current_lbl.ForeColor = MUTED_TEXT
+            current_lbl.BackColor = DARK_BG
+            table.Controls.Add(current_lbl, 1, row)
+
+            if ptype == "bool":
+                cb = CheckBox()
+                cb.ThreeState = True
+                cb.CheckState = CheckState.Indeterminate
+                cb.Text = "(tick = Yes, untick = No; dash = keep)"
+                cb.AutoSize = True
+                cb.ForeColor = DARK_TEXT
+                cb.BackColor = DARK_BG
+                table.Controls.Add(cb, 2, row)
+
+                unit_lbl = Label()
+                unit_lbl.Text = ""
+                unit_lbl.AutoSize = True
+                unit_lbl.ForeColor = MUTED_TEXT
+                unit_lbl.BackColor = DARK_BG
+                table.Controls.Add(unit_lbl, 3, row)
+
+                _mark_dirty(cb, len(editors))
+                editors.append(("bool", name, cb, ptype))
+            else:
+                tb = TextBox()
+                tb.Width = 310
+                tb.Text = ""
+                tb.BackColor = DARK_PANEL
+                tb.ForeColor = DARK_TEXT
+                tb.BorderStyle = BorderStyle.FixedSingle
+                table.Controls.Add(tb, 2, row)
+
+                unit_lbl = Label()
+                unit_lbl.Text = unit
+                unit_lbl.AutoSize = True
+                unit_lbl.ForeColor = MUTED_TEXT
+                unit_lbl.BackColor = DARK_BG
+                table.Controls.Add(unit_lbl, 3, row)
+
+                _mark_dirty(tb, len(editors))
+                editors.append(("text", name, tb, ptype))
+
+            row += 1
     # ---------------------------------------------------------------------
 
     # -------------------- buttons ----------------------------------------
@@ -296,34 +521,47 @@ def bulk_edit(editable_params, title="Edit Parameters (Bulk)"):
             fa.BorderColor = BORDER_CLR
             fa.MouseOverBackColor = BTN_HOVER
 
-    table.RowCount = row + 1
     table.Controls.Add(btn_ok,     2, row)
     table.Controls.Add(btn_cancel, 3, row)
 
     form.AcceptButton = btn_ok
     form.CancelButton = btn_cancel
     form.Controls.Add(table)
+    table.ResumeLayout(False)
+    form.ResumeLayout(False)
+    form.PerformLayout()
     # ---------------------------------------------------------------------
 
-    # Show and collect
-    result = form.ShowDialog()
-    if result != DialogResult.OK:
-        return None
-
-    changes = {}
-    for kind, name, ctrl, ptype in editors:
-        if kind == "bool":
-            st = ctrl.CheckState
-            if st == CheckState.Indeterminate:
-                continue
-            changes[name] = (st == CheckState.Checked)
-        else:
-            raw = _safe_text(ctrl.Text).strip()
-            if raw == "":
-                continue
-            parsed = _parse_value(ptype, "", raw)
-            if parsed is None:
-                continue
-            changes[name] = parsed
-
-    return changes
+    # Show and collect; values are read before the form (and its controls'
+    # handles) is disposed, on both the OK and Cancel paths.
+    try:
+        result = form.ShowDialog()
+        if result != DialogResult.OK:
+            return None
+        if grid is not None:
+            grid.EndEdit()   # commit a cell still in edit mode
+
+        changes = {}
+        for i in sorted(_dirty_rows):
+            kind, name, ctrl, ptype = editors[i]
+            if kind == "bool":
+                st = ctrl.CheckState
+                if st == CheckState.Indeterminate:
+                    continue
+                changes[name] = (st == CheckState.Checked)
+            else:
+                # grid mode keeps typed text in _grid_new (Yes/No parsed per ptype)
+                raw = (_grid_new.get(i, "") if ctrl is None else _safe_text(ctrl.Text)).strip()
+                if raw == "":
+                    continue
+                parsed = _parse_value(ptype, "", raw)
+                if parsed is None:
+                    continue
+                changes[name] = parsed
+
+        return changes
+    finally:
+        form.Dispose()
+        # only now: controls and the grid header style referenced them until here
+        HDR_FONT.Dispose()
+        CLOSE_FONT.Dispose()
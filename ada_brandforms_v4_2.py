@@ -12,37 +12,51 @@ BRAND = {"BLUE": "#5C7CFA", "PINK": "#F759C0", "BG": "#1F222A", "FG": "#FFFFFF"}
 
 # Try WPF
 try:
+    try:
+        from ._ada_wpf_bootstrap import ensure_wpf as _ensure_wpf
+    except ImportError:
+        from _ada_wpf_bootstrap import ensure_wpf as _ensure_wpf
+    _ensure_wpf()
     import clr as _clr
-    _clr.AddReference("WindowsBase")
-    _clr.AddReference("PresentationCore")
-    _clr.AddReference("PresentationFramework")
     from System.Windows.Markup import XamlReader
-    from System.Windows.Media import SolidColorBrush, Color
-    from System.Windows import WindowStartupLocation, Thickness, SystemParameters
-    from System.Windows.Controls import Button, TextBlock, TextBox, ListBox, StackPanel
+    from System.Windows.Media import SolidColorBrush, LinearGradientBrush, Color
+    from System.Windows import (WindowStartupLocation, Thickness, SystemParameters, Window, WindowStyle,
+                                Style, Setter, FrameworkElement, Size,
+                                SizeToContent, GridLength, GridUnitType, CornerRadius, Point,
+                                HorizontalAlignment, VerticalAlignment, TextWrapping, TextTrimming, FontWeights)
+    from System.Windows.Controls import (Button, TextBlock, TextBox, ListBox, StackPanel, Grid, RowDefinition,
+                                         Border, ScrollViewer, ScrollBarVisibility, Orientation, Control)
     from System.Windows.Interop import WindowInteropHelper
     from System.Diagnostics import Process
+    from System.Collections.Generic import List
+    from System import Object
+    from System.IO import MemoryStream
+    from System.Text import Encoding
     _WPF = True
 except Exception:
     _WPF = False
 
 
-def _hex_to_color(h):
-    h = h.strip().lstrip("#")
-    if len(h) == 6:
-        r, g, b, a = int(h[:2], 16), int(h[2:4], 16), int(h[4:6], 16), 255
-    elif len(h) == 8:
-        a, r, g, b = int(h[:2], 16), int(h[2:4], 16), int(h[4:6], 16), int(h[6:8], 16)
-    else:
-        r = g = b = 0
-        a = 255
-    return Color.FromArgb(a, r, g, b)
+if _WPF:
+    # Brand colours as Color structs, parsed once from the BRAND hex strings
+    BRAND_COLORS = {k: Color.FromRgb(*bytes.fromhex(v.lstrip("#"))) for k, v in BRAND.items()}
+    ADABLUE = BRAND_COLORS["BLUE"]
+    ADAPINK = BRAND_COLORS["PINK"]
+    FGCOLOR = BRAND_COLORS["FG"]
+    BGCOLOR = BRAND_COLORS["BG"]
 
+    # Shared, frozen brushes: every dialog/button reuses these instead of
+    # allocating its own (frozen Freezables are immutable and cheap to share).
+    def _frozen(brush):
+        brush.Freeze()
+        return brush
 
-if _WPF:
-    ADABLUE = _hex_to_color(BRAND["BLUE"])
-    ADAPINK = _hex_to_color(BRAND["PINK"])
-    FGCOLOR = _hex_to_color(BRAND["FG"])
+    _BR_BLUE = _frozen(SolidColorBrush(ADABLUE))
+    _BR_PINK = _frozen(SolidColorBrush(ADAPINK))
+    _BR_FG = _frozen(SolidColorBrush(FGCOLOR))
+    _BR_BG = _frozen(SolidColorBrush(BGCOLOR))
+    _BR_HEADER = _frozen(LinearGradientBrush(ADABLUE, ADAPINK, Point(0, 0), Point(1, 0)))
+    _T_BTN_PAD = Thickness(18, 6, 18, 6)
 
     def _chrome(win):
         try:
@@ -52,32 +66,47 @@ if _WPF:
         except Exception:
             pass
 
+    def _place_center(win, top_offset, owned):
+        win.WindowStartupLocation = (WindowStartupLocation.CenterOwner if owned
+                                     else WindowStartupLocation.CenterScreen)
+
+    _TOP_CENTER_HANDLERS = {}
+
+    def _top_center_handler(top_offset):
+        """Loaded handler for a given offset; built once per offset and reused."""
+        top = float(top_offset or 0)
+        h = _TOP_CENTER_HANDLERS.get(top)
+        if h is None:
+            def h(s, e):
+                wa = SystemParameters.WorkArea
+                s.Left = (wa.Width - s.ActualWidth) / 2 + wa.Left
+                s.Top = wa.Top + top
+            _TOP_CENTER_HANDLERS[top] = h
+        return h
+
+    def _place_top_center(win, top_offset, owned):
+        win.WindowStartupLocation = WindowStartupLocation.Manual
+        win.Loaded += _top_center_handler(top_offset)
+
+    _POSITION_HANDLERS = {"top": _place_top_center, "top-center": _place_top_center}
+
+    _REVIT_HWND = [None]
+
+    def _revit_hwnd():
+        """Revit main window handle, resolved once (MainWindowHandle enumerates windows)."""
+        h = _REVIT_HWND[0]
+        if h is None or h.ToInt64() == 0:
+            h = _REVIT_HWND[0] = Process.GetCurrentProcess().MainWindowHandle
+        return h
+
     def _set_owner_and_position(win, position="center", top_offset=24):
         """Center relative to Revit main window by default; 'top-center' available."""
         try:
-            WindowInteropHelper(win).Owner = Process.GetCurrentProcess().MainWindowHandle
-            if position in ("center", None):
-                win.WindowStartupLocation = WindowStartupLocation.CenterOwner
-            elif position in ("top", "top-center"):
-                win.WindowStartupLocation = WindowStartupLocation.Manual
-                def _on_loaded(s, e):
-                    wa = SystemParameters.WorkArea
-                    s.Left = (wa.Width - s.ActualWidth) / 2 + wa.Left
-                    s.Top = wa.Top + float(top_offset or 0)
-                win.Loaded += _on_loaded
-            else:
-                win.WindowStartupLocation = WindowStartupLocation.CenterOwner
+            WindowInteropHelper(win).Owner = _revit_hwnd()
+            owned = True
         except Exception:
-            # fallback if owner can't be set
-            if position in ("top", "top-center"):
-                win.WindowStartupLocation = WindowStartupLocation.Manual
-                def _on_loaded2(s, e):
-                    wa = SystemParameters.WorkArea
-                    s.Left = (wa.Width - s.ActualWidth) / 2 + wa.Left
-                    s.Top = wa.Top + float(top_offset or 0)
-                win.Loaded += _on_loaded2
-            else:
-                win.WindowStartupLocation = WindowStartupLocation.CenterScreen
+            owned = False  # no owner: centre on screen instead
+        _POSITION_HANDLERS.get(position, _place_center)(win, top_offset, owned)
 
     def _size_attrs(autosize, minw, minh, maxw, maxh, width, height):
         if autosize and (width is None and height is None):
@@ -91,72 +120,189 @@ if _WPF:
             w, h, minw, minh, maxw, maxh
         )
 
+    def _apply_size(win, autosize, minw, minh, maxw, maxh, width, height):
+        """Imperative twin of _size_attrs."""
+        if autosize and (width is None and height is None):
+            win.SizeToContent = SizeToContent.WidthAndHeight
+        else:
+            win.Width = width if width is not None else minw
+            win.Height = height if height is not None else minh
+        win.MinWidth, win.MinHeight, win.MaxWidth, win.MaxHeight = minw, minh, maxw, maxh
+
+    def _fit_width_once(win, grid, minw, maxw):
+        """Measure content once at maxw and fix the window width from it.
+
+        SizeToContent=WidthAndHeight measures at infinite width and then lays out
+        again; with the width pinned only the (cheap) height is sized to content.
+        """
+        grid.Measure(Size(float(maxw), float("inf")))
+        frame = 2 * SystemParameters.ResizeFrameVerticalBorderWidth
+        win.SizeToContent = SizeToContent.Height
+        win.Width = max(float(minw), min(float(maxw), grid.DesiredSize.Width + frame))
+
+    def _shell(title, autosize, minw, minh, maxw, maxh, width, height):
+        """Branded window built in code: gradient header + title, body row, button bar.
+
+        Returns (window, grid, button_bar); callers put their content in grid row 1.
+        """
+        win = Window()
+        win.Title = str(title)
+        _apply_size(win, autosize, minw, minh, maxw, maxh, width, height)
+        win.Background = _BR_BG
+        win.WindowStyle = WindowStyle.SingleBorderWindow
+        win.SnapsToDevicePixels = True
+        win.UseLayoutRounding = True
+
+        grid = Grid()
+        for h in (GridLength(64), GridLength(1, GridUnitType.Star), GridLength.Auto):
+            rd = RowDefinition()
+            rd.Height = h
+            grid.RowDefinitions.Add(rd)
+        win.Content = grid
+
+        header = Border()
+        header.CornerRadius = CornerRadius(6, 6, 0, 0)
+        header.Background = _BR_HEADER
+        grid.Children.Add(header)
+
+        tt = TextBlock()
+        tt.Margin = Thickness(16, 18, 16, 0)
+        tt.VerticalAlignment = VerticalAlignment.Center
+        tt.Foreground = _BR_FG
+        tt.FontSize = 18
+        tt.FontWeight = FontWeights.SemiBold
+        tt.TextTrimming = TextTrimming.CharacterEllipsis
+        tt.Text = str(title)
+        grid.Children.Add(tt)
+
+        bar = StackPanel()
+        bar.Orientation = Orientation.Horizontal
+        bar.HorizontalAlignment = HorizontalAlignment.Right
+        bar.Margin = Thickness(0, 6, 16, 16)
+        Grid.SetRow(bar, 2)
+        grid.Children.Add(bar)
+        return win, grid, bar
+
+    def _button_style(background):
+        """Sealed branded Button style: one style application instead of 5 setters."""
+        st = Style(_clr.GetClrType(Button))
+        for prop, value in ((Control.PaddingProperty, _T_BTN_PAD),
+                            (FrameworkElement.MinWidthProperty, 110.0),
+                            (FrameworkElement.MinHeightProperty, 36.0),
+                            (Control.ForegroundProperty, _BR_FG),
+                            (Control.BackgroundProperty, background)):
+            st.Setters.Add(Setter(prop, value))
+        st.Seal()
+        return st
+
+    _BTN_PRIMARY = _button_style(_BR_BLUE)
+    _BTN_SECONDARY = _button_style(_BR_PINK)
+
+    def _brand_button(text, primary, margin):
+        b = Button()
+        b.Content = text
+        b.Margin = margin
+        b.Style = _BTN_PRIMARY if primary else _BTN_SECONDARY
+        return b
+
+    # SelectFromList's XAML skeleton, formatted and UTF-8 encoded once per static
+    # layout; per-call text (title, button caption) is set after load.
+    _XAML_CACHE = {}
+
+    def _load_xaml(key, template, **static):
+        data = _XAML_CACHE.get(key)
+        if data is None:
+            xaml = template.format(
+                blue=BRAND["BLUE"], pink=BRAND["PINK"], bg=BRAND["BG"], fg=BRAND["FG"], **static)
+            data = _XAML_CACHE[key] = Encoding.UTF8.GetBytes(xaml)
+        return XamlReader.Load(MemoryStream(data))
+
+    def _pick_buttons(mask):
+        yes, no, ok, cancel = bool(mask & 8), bool(mask & 4), bool(mask & 2), bool(mask & 1)
+        if yes and no:
+            return (("Yes", "yes"), ("No", "no"))
+        if ok and cancel:
+            return (("OK", "ok"), ("Cancel", "cancel"))
+        if ok or not (yes or no or cancel):
+            return (("OK", "ok"),)
+        return (("Cancel", "cancel"),)
+
+    # alert button sets for every yes/no/ok/cancel combination (bit mask 0bYNOC)
+    _BTN_TABLE = {mask: _pick_buttons(mask) for mask in range(16)}
+
+    # Select dialog: gradient header + title, virtualized list, OK/Cancel bar
+    _SELECT_XAML = u"""
+    <Window xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+            xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml"
+            {size_attr} Background="{bg}" WindowStyle="SingleBorderWindow"
+            SnapsToDevicePixels="True" UseLayoutRounding="True">
+      <Grid Margin="0">
+        <Grid.RowDefinitions>
+          <RowDefinition Height="64"/>
+          <RowDefinition Height="*"/>
+          <RowDefinition Height="Auto"/>
+        </Grid.RowDefinitions>
+        <Border Grid.Row="0" CornerRadius="6,6,0,0">
+          <Border.Background>
+            <LinearGradientBrush StartPoint="0,0" EndPoint="1,0">
+              <GradientStop Color="{blue}" Offset="0"/>
+              <GradientStop Color="{pink}" Offset="1"/>
+            </LinearGradientBrush>
+          </Border.Background>
+        </Border>
+        <TextBlock x:Name="TitleText" Grid.Row="0" Margin="16,18,16,0" VerticalAlignment="Center"
+                   Foreground="{fg}" FontSize="18" FontWeight="SemiBold"
+                   TextTrimming="CharacterEllipsis"/>
+        <ListBox x:Name="LB" Grid.Row="1" Margin="16,16,16,8" SelectionMode="{sel}" MaxWidth="{maxw}"
+                 VirtualizingStackPanel.IsVirtualizing="True"
+                 VirtualizingStackPanel.VirtualizationMode="Recycling"
+                 ScrollViewer.CanContentScroll="True"
+                 ScrollViewer.IsDeferredScrollingEnabled="True"/>
+        <StackPanel x:Name="ButtonBar" Grid.Row="2" Orientation="Horizontal" HorizontalAlignment="Right" Margin="0,6,16,16">
+          <Button x:Name="OkBtn" Margin="8"/>
+          <Button x:Name="CancelBtn" Content="Cancel" Margin="8"/>
+        </StackPanel>
+      </Grid>
+    </Window>
+    """
+
     class BrandForms(object):
         @staticmethod
         def alert(message, title="Message", yes=False, no=False, ok=False, cancel=False, *, autosize=True,
                   minw=560, minh=260, maxw=1100, maxh=900, width=None, height=None, position="center", top_offset=24):
-            if yes and no:
-                btns = [("Yes", "yes"), ("No", "no")]
-            elif ok and cancel:
-                btns = [("OK", "ok"), ("Cancel", "cancel")]
-            elif ok or not any([yes, no, cancel]):
-                btns = [("OK", "ok")]
-            else:
-                btns = [("Cancel", "cancel")]
-
-            size_attr = _size_attrs(autosize, minw, minh, maxw, maxh, width, height)
-            xaml = u"""
-            <Window xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
-                    xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml"
-                    Title="{title}" {size_attr} Background="{bg}" WindowStyle="SingleBorderWindow"
-                    SnapsToDevicePixels="True" UseLayoutRounding="True">
-              <Grid Margin="0">
-                <Grid.RowDefinitions>
-                  <RowDefinition Height="64"/>
-                  <RowDefinition Height="*"/>
-                  <RowDefinition Height="Auto"/>
-                </Grid.RowDefinitions>
-                <Border Grid.Row="0" CornerRadius="6,6,0,0">
-                  <Border.Background>
-                    <LinearGradientBrush StartPoint="0,0" EndPoint="1,0">
-                      <GradientStop Color="{blue}" Offset="0"/>
-                      <GradientStop Color="{pink}" Offset="1"/>
-                    </LinearGradientBrush>
-                  </Border.Background>
-                </Border>
-                <TextBlock Grid.Row="0" Margin="16,18,16,0" VerticalAlignment="Center"
-                           Text="{title}" Foreground="{fg}" FontSize="18" FontWeight="SemiBold"
-                           TextTrimming="CharacterEllipsis"/>
-                <ScrollViewer Grid.Row="1" Margin="16,16,16,8" VerticalScrollBarVisibility="Auto" MaxWidth="{maxw}">
-                  <TextBlock TextWrapping="Wrap" Foreground="{fg}" FontSize="14">{message}</TextBlock>
-                </ScrollViewer>
-                <StackPanel x:Name="ButtonBar" Grid.Row="2" Orientation="Horizontal" HorizontalAlignment="Right" Margin="0,6,16,16"/>
-              </Grid>
-            </Window>
-            """.format(title=title, message=message, size_attr=size_attr, blue=BRAND["BLUE"],
-                       pink=BRAND["PINK"], bg=BRAND["BG"], fg=BRAND["FG"], maxw=int(maxw))
-
-            win = XamlReader.Parse(xaml)
-            _chrome(win)
-            _set_owner_and_position(win, position, top_offset)
+            btns = _BTN_TABLE[(bool(yes) << 3) | (bool(no) << 2) | (bool(ok) << 1) | bool(cancel)]
+
+            win, grid, panel = _shell(title, autosize, minw, minh, maxw, maxh, width, height)
+
+            sv = ScrollViewer()
+            sv.Margin = Thickness(16, 16, 16, 8)
+            sv.VerticalScrollBarVisibility = ScrollBarVisibility.Auto
+            sv.MaxWidth = int(maxw)
+            body = TextBlock()
+            body.TextWrapping = TextWrapping.Wrap
+            body.Foreground = _BR_FG
+            body.FontSize = 14
+            body.Text = str(message)
+            sv.Content = body
+            Grid.SetRow(sv, 1)
+            grid.Children.Add(sv)
 
-            panel = win.FindName("ButtonBar")
             result = [None]
+            def _click(s, e):   # one handler for every button; token rides on Tag
+                result[0] = s.Tag
+                win.Close()
             for i, (text, token) in enumerate(btns):
-                b = Button()
-                b.Content = text
-                b.Margin = Thickness(8, 8, 0, 8)
-                b.Padding = Thickness(18, 6, 18, 6)
-                b.MinWidth = 110
-                b.MinHeight = 36
-                b.Foreground = SolidColorBrush(FGCOLOR)
-                b.Background = SolidColorBrush(ADABLUE if i == 0 else ADAPINK)
-                def _click(s, e, tok=token):
-                    result[0] = tok
-                    win.Close()
+                b = _brand_button(text, i == 0, Thickness(8, 8, 0, 8))
+                b.Tag = token
                 b.Click += _click
                 panel.Children.Add(b)
 
+            # Measure with the button bar in place so its width counts too
+            if autosize and width is None and height is None:
+                _fit_width_once(win, grid, minw, maxw)
+            _chrome(win)
+            _set_owner_and_position(win, position, top_offset)
+
             win.ShowDialog()
             if result[0] in ("yes", "ok"):
                 return True
@@ -167,53 +313,35 @@ if _WPF:
         @staticmethod
         def ask_for_string(prompt="", default=None, title="Input", *, autosize=True,
                            minw=600, minh=260, maxw=1100, maxh=900, width=None, height=None, position="center", top_offset=24):
-            size_attr = _size_attrs(autosize, minw, minh, maxw, maxh, width, height)
-            xaml = u"""
-            <Window xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
-                    xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml"
-                    Title="{title}" {size_attr} Background="{bg}" WindowStyle="SingleBorderWindow"
-                    SnapsToDevicePixels="True" UseLayoutRounding="True">
-              <Grid Margin="0">
-                <Grid.RowDefinitions>
-                  <RowDefinition Height="64"/>
-                  <RowDefinition Height="*"/>
-                  <RowDefinition Height="Auto"/>
-                </Grid.RowDefinitions>
-                <Border Grid.Row="0" CornerRadius="6,6,0,0">
-                  <Border.Background>
-                    <LinearGradientBrush StartPoint="0,0" EndPoint="1,0">
-                      <GradientStop Color="{blue}" Offset="0"/>
-                      <GradientStop Color="{pink}" Offset="1"/>
-                    </LinearGradientBrush>
-                  </Border.Background>
-                </Border>
-                <TextBlock Grid.Row="0" Margin="16,18,16,0" VerticalAlignment="Center"
-                           Text="{title}" Foreground="{fg}" FontSize="18" FontWeight="SemiBold"
-                           TextTrimming="CharacterEllipsis"/>
-                <StackPanel Grid.Row="1" Margin="16,16,16,8" MaxWidth="{maxw}">
-                  <TextBlock TextWrapping="Wrap" Foreground="{fg}" FontSize="14" Margin="0,0,0,8">{prompt}</TextBlock>
-                  <TextBox x:Name="InputBox" Text="{default}" FontSize="14" Padding="8" HorizontalAlignment="Stretch"/>
-                </StackPanel>
-                <StackPanel x:Name="ButtonBar" Grid.Row="2" Orientation="Horizontal" HorizontalAlignment="Right" Margin="0,6,16,16">
-                  <Button x:Name="OkBtn" Content="OK" Margin="8" Padding="18,6" MinWidth="110" MinHeight="36"/>
-                  <Button x:Name="CancelBtn" Content="Cancel" Margin="8" Padding="18,6" MinWidth="110" MinHeight="36"/>
-                </StackPanel>
-              </Grid>
-            </Window>
-            """.format(title=title, prompt=prompt, default=default or "", size_attr=size_attr, blue=BRAND["BLUE"],
-                       pink=BRAND["PINK"], bg=BRAND["BG"], fg=BRAND["FG"], maxw=int(maxw))
-
-            win = XamlReader.Parse(xaml)
+            win, grid, panel = _shell(title, autosize, minw, minh, maxw, maxh, width, height)
+
+            sp = StackPanel()
+            sp.Margin = Thickness(16, 16, 16, 8)
+            sp.MaxWidth = int(maxw)
+            tb = TextBlock()
+            tb.TextWrapping = TextWrapping.Wrap
+            tb.Foreground = _BR_FG
+            tb.FontSize = 14
+            tb.Margin = Thickness(0, 0, 0, 8)
+            tb.Text = str(prompt)
+            sp.Children.Add(tb)
+            box = TextBox()
+            box.FontSize = 14
+            box.Padding = Thickness(8)
+            box.HorizontalAlignment = HorizontalAlignment.Stretch
+            box.Text = str(default or "")
+            sp.Children.Add(box)
+            Grid.SetRow(sp, 1)
+            grid.Children.Add(sp)
+
+            okb = _brand_button("OK", True, Thickness(8))
+            cb = _brand_button("Cancel", False, Thickness(8))
+            panel.Children.Add(okb)
+            panel.Children.Add(cb)
+
             _chrome(win)
             _set_owner_and_position(win, position, top_offset)
 
-            okb = win.FindName("OkBtn")
-            cb = win.FindName("CancelBtn")
-            box = win.FindName("InputBox")
-            okb.Foreground = SolidColorBrush(FGCOLOR)
-            cb.Foreground = SolidColorBrush(FGCOLOR)
-            okb.Background = SolidColorBrush(ADABLUE)
-            cb.Background = SolidColorBrush(ADAPINK)
             result = [None]
             def _ok(s, e):
                 result[0] = box.Text
@@ -236,52 +364,25 @@ if _WPF:
                                         width if not autosize else None,
                                         height if not autosize else None)
                 sel = "Extended" if multiselect else "Single"
-                xaml = u"""
-                <Window xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
-                        xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml"
-                        Title="{title}" {size_attr} Background="{bg}" WindowStyle="SingleBorderWindow"
-                        SnapsToDevicePixels="True" UseLayoutRounding="True">
-                  <Grid Margin="0">
-                    <Grid.RowDefinitions>
-                      <RowDefinition Height="64"/>
-                      <RowDefinition Height="*"/>
-                      <RowDefinition Height="Auto"/>
-                    </Grid.RowDefinitions>
-                    <Border Grid.Row="0" CornerRadius="6,6,0,0">
-                      <Border.Background>
-                        <LinearGradientBrush StartPoint="0,0" EndPoint="1,0">
-                          <GradientStop Color="{blue}" Offset="0"/>
-                          <GradientStop Color="{pink}" Offset="1"/>
-                        </LinearGradientBrush>
-                      </Border.Background>
-                    </Border>
-                    <TextBlock Grid.Row="0" Margin="16,18,16,0" VerticalAlignment="Center"
-                               Text="{title}" Foreground="{fg}" FontSize="18" FontWeight="SemiBold"
-                               TextTrimming="CharacterEllipsis"/>
-                    <ListBox x:Name="LB" Grid.Row="1" Margin="16,16,16,8" SelectionMode="{sel}" MaxWidth="{maxw}"/>
-                    <StackPanel x:Name="ButtonBar" Grid.Row="2" Orientation="Horizontal" HorizontalAlignment="Right" Margin="0,6,16,16">
-                      <Button x:Name="OkBtn" Content="{button}" Margin="8" Padding="18,6" MinWidth="110" MinHeight="36"/>
-                      <Button x:Name="CancelBtn" Content="Cancel" Margin="8" Padding="18,6" MinWidth="110" MinHeight="36"/>
-                    </StackPanel>
-                  </Grid>
-                </Window>
-                """.format(title=title, sel=sel, button=button_name, size_attr=size_attr, blue=BRAND["BLUE"],
-                           pink=BRAND["PINK"], bg=BRAND["BG"], fg=BRAND["FG"], maxw=int(maxw))
-
-                win = XamlReader.Parse(xaml)
+                win = _load_xaml(("select", size_attr, int(maxw), sel), _SELECT_XAML,
+                                 size_attr=size_attr, maxw=int(maxw), sel=sel)
+                win.Title = str(title)
+                win.FindName("TitleText").Text = str(title)
                 _chrome(win)
                 _set_owner_and_position(win, position, top_offset)
 
                 lb = win.FindName("LB")
                 okb = win.FindName("OkBtn")
+                okb.Content = str(button_name)
                 cb = win.FindName("CancelBtn")
-                okb.Foreground = SolidColorBrush(FGCOLOR)
-                cb.Foreground = SolidColorBrush(FGCOLOR)
-                okb.Background = SolidColorBrush(ADABLUE)
-                cb.Background = SolidColorBrush(ADAPINK)
+                okb.Style = _BTN_PRIMARY
+                cb.Style = _BTN_SECONDARY
 
+                # One ItemsSource assignment instead of a CollectionChanged per Items.Add
+                items = List[Object]()
                 for it in options:
-                    lb.Items.Add(it)
+                    items.Add(it)
+                lb.ItemsSource = items
 
                 result = [None]
                 def _ok(s, e):
@@ -302,12 +403,12 @@ if _WPF:
     FORMS_BRANDED = True
 
 else:
-    # Fallbacks
-    try:
-        from pyrevit import forms as _pyforms
-        forms = _pyforms
-        FORMS_BRANDED = False
-    except Exception:
+    # Fallbacks, resolved on first use of `forms` (PEP 562) so importing this
+    # module never pays for pyRevit forms or WinForms unless they are needed:
+    # pyRevit forms first, then a WinForms/TaskDialog shim.
+    FORMS_BRANDED = False
+
+    def _build_shim():
         import clr
         clr.AddReference("System")
         clr.AddReference("System.Drawing")
@@ -404,7 +505,36 @@ else:
                     ca.SetBounds(width - 110, height - 60, 80, 24)
                     ca.DialogResult = DialogResult.Cancel
                     f.Controls.Add(ca)
-                    return [lb.Items[i] for i in range(lb.Items.Count) if lb.GetSelected(i)] if f.ShowDialog() == DialogResult.OK else None
+                    return list(lb.SelectedItems) if f.ShowDialog() == DialogResult.OK else None
+
+        return _Shim
+
+    def _fallback_forms():
+        try:
+            import importlib
+            return importlib.import_module("pyrevit.forms")
+        except Exception:
+            return _build_shim()
+
+    class _LazyForms(object):
+        """Real module global for `forms`; resolves pyrevit.forms (or the shim) on first use."""
+        __slots__ = ("_target", "_error")
+
+        def __init__(self):
+            self._target = None
+            self._error = None   # failure from the one resolve attempt, re-raised after
+
+        def __getattr__(self, name):
+            t = self._target
+            if t is None:
+                if self._error is None:
+                    try:
+                        t = self._target = _fallback_forms()
+                    except Exception as ex:
+                        self._error = ex
+                if t is None:
+                    # AttributeError keeps hasattr(forms, ...) probes working
+                    raise AttributeError("forms backend unavailable: {!r}".format(name)) from self._error
+            return getattr(t, name)
 
-        forms = _Shim
-        FORMS_BRANDED = False
+    forms = _LazyForms()
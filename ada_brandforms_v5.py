@@ -1,31 +1,51 @@
 # ada_brandforms_v5.py  — ADa-branded dialogs with custom window chrome
-import clr
-clr.AddReference("PresentationCore")
-clr.AddReference("PresentationFramework")
-clr.AddReference("WindowsBase")
+try:
+    from ._ada_wpf_bootstrap import ensure_wpf
+except ImportError:
+    from _ada_wpf_bootstrap import ensure_wpf
+ensure_wpf()
 
+from System import InvalidOperationException #type:ignore
 from System.Windows import Window, WindowStartupLocation, Thickness, HorizontalAlignment, VerticalAlignment, SizeToContent #type:ignore
+from System.Windows import Size, SystemParameters #type:ignore
 from System.Windows.Controls import Grid, RowDefinition, ColumnDefinition, TextBlock, Button, Border, StackPanel #type:ignore
 from System.Windows.Media import SolidColorBrush, LinearGradientBrush, GradientStop, GradientStopCollection #type:ignore
 from System.Windows.Media import Color, Colors #type:ignore
 from System.Windows.Input import MouseButtonState, Key #type:ignore
 from System.Windows.Shell import WindowChrome #type:ignore
-from System import String #type:ignore
 
 ADA_BLUE = Color.FromRgb(0x5C,0x7C,0xFA)   # #5C7CFA
 ADA_PINK = Color.FromRgb(0xF7,0x59,0xC0)   # #F759C0
 BG_DARK  = Color.FromRgb(0x1F,0x23,0x2B)   # dark body
 FG_LIGHT = Color.FromRgb(0xE8,0xEA,0xED)
 
+def _frozen_brush(color):
+    br = SolidColorBrush(color)
+    br.Freeze()   # shareable across every dialog and button
+    return br
+
+_BR_BLUE  = _frozen_brush(ADA_BLUE)
+_BR_PINK  = _frozen_brush(ADA_PINK)
+_BR_BG    = _frozen_brush(BG_DARK)
+_BR_FG    = _frozen_brush(FG_LIGHT)
+_BR_WHITE = _frozen_brush(Colors.White)
+_T_BTN_MARGIN = Thickness(8,0,0,0)
+
 def _grad_header():
     gs = GradientStopCollection()
-    gs.Add(GradientStop(SolidColorBrush(ADA_BLUE).Color, 0.0))
-    gs.Add(GradientStop(SolidColorBrush(ADA_PINK).Color, 1.0))
+    gs.Add(GradientStop(ADA_BLUE, 0.0))
+    gs.Add(GradientStop(ADA_PINK, 1.0))
     return LinearGradientBrush(gs, 0)
 
+# Header gradient shared (frozen) by every dialog; radius as the header used before
+_HEADER_BRUSH = _grad_header()
+_HEADER_BRUSH.Freeze()
+_CR_HEADER = Thickness(8,8,0,0).TopLeft
+
 class _AdaDialog(Window):
-    def __init__(self, title, body_text, buttons):
+    def __init__(self, title, body_text, buttons, pooled=False):
         Window.__init__(self)
+        self._pooled = pooled
         # ---- remove OS chrome, keep shadow via WindowChrome
         self.WindowStyle = 0      # None
         self.ResizeMode = 0       # NoResize
@@ -39,7 +59,7 @@ class _AdaDialog(Window):
         self.Title = str(title or "")
         self.SizeToContent = SizeToContent.WidthAndHeight
         self.WindowStartupLocation = WindowStartupLocation.CenterScreen
-        self.Background = SolidColorBrush(BG_DARK)
+        self.Background = _BR_BG
         self.Padding = Thickness(0)
         self._result = None
 
@@ -51,7 +71,7 @@ class _AdaDialog(Window):
         self.Content = root
 
         # Header
-        header = Border(Background=_grad_header(), CornerRadius=Thickness(8,8,0,0).TopLeft)
+        header = Border(Background=_HEADER_BRUSH, CornerRadius=_CR_HEADER)
         Grid.SetRow(header, 0)
         headerGrid = Grid()
         headerGrid.ColumnDefinitions.Add(ColumnDefinition())
@@ -60,16 +80,17 @@ class _AdaDialog(Window):
         root.Children.Add(header)
 
         title_tb = TextBlock(Text=str(title or ""), Margin=Thickness(20,14,20,0),
-                             Foreground=SolidColorBrush(FG_LIGHT), FontSize=22)
+                             Foreground=_BR_FG, FontSize=22)
         title_tb.VerticalAlignment = VerticalAlignment.Center
         Grid.SetColumn(title_tb, 0)
         headerGrid.Children.Add(title_tb)
+        self._title_tb = title_tb
 
         btn_close = Button(Content="✕", Width=36, Height=28, Margin=Thickness(0,10,10,0))
         btn_close.HorizontalAlignment = HorizontalAlignment.Right
         btn_close.VerticalAlignment = VerticalAlignment.Center
-        btn_close.Background = SolidColorBrush(ADA_PINK)
-        btn_close.Foreground = SolidColorBrush(Colors.White)
+        btn_close.Background = _BR_PINK
+        btn_close.Foreground = _BR_WHITE
         btn_close.BorderThickness = Thickness(0)
         btn_close.Cursor = None
         btn_close.Click += lambda s,e: self._close(False)
@@ -84,15 +105,16 @@ class _AdaDialog(Window):
         header.MouseLeftButtonDown += _drag
 
         # Body
-        body_border = Border(Margin=Thickness(24,20,24,0), Background=SolidColorBrush(BG_DARK))
+        body_border = Border(Margin=Thickness(24,20,24,0), Background=_BR_BG)
         Grid.SetRow(body_border, 1)
         root.Children.Add(body_border)
         body_tb = TextBlock(Text=str(body_text or ""), TextWrapping=0x2,  # Wrap
-                            Foreground=SolidColorBrush(FG_LIGHT), FontSize=16)
+                            Foreground=_BR_FG, FontSize=16)
         body_border.Child = body_tb
+        self._body_tb = body_tb
 
         # Buttons
-        btn_row = Border(Margin=Thickness(24,18,24,20), Background=SolidColorBrush(BG_DARK))
+        btn_row = Border(Margin=Thickness(24,18,24,20), Background=_BR_BG)
         Grid.SetRow(btn_row, 2)
         root.Children.Add(btn_row)
 
@@ -100,19 +122,22 @@ class _AdaDialog(Window):
         btn_row.Child = btn_panel
 
         def make_btn(label, is_primary=False):
-            b = Button(Content=String(label), Width=110, Height=36, Margin=Thickness(8,0,0,0))
+            b = Button(Content=label, Width=110, Height=36, Margin=_T_BTN_MARGIN)
             b.BorderThickness = Thickness(0)
             if is_primary:
-                b.Background = SolidColorBrush(ADA_BLUE)
-                b.Foreground = SolidColorBrush(Colors.White)
+                b.Background = _BR_BLUE
+                b.Foreground = _BR_WHITE
             else:
-                b.Background = SolidColorBrush(ADA_PINK)
-                b.Foreground = SolidColorBrush(Colors.White)
+                b.Background = _BR_PINK
+                b.Foreground = _BR_WHITE
             return b
 
+        def _on_btn(sender, e):   # one handler for every button; label rides on Tag
+            self._close(sender.Tag)
         for i, lab in enumerate(buttons):
             b = make_btn(lab, is_primary=(i==0))
-            b.Click += (lambda s,e,lab=lab: self._close(lab))
+            b.Tag = lab
+            b.Click += _on_btn
             btn_panel.Children.Add(b)
 
         # Keyboard: ESC cancels, Enter = primary
@@ -123,14 +148,55 @@ class _AdaDialog(Window):
                 self._close(buttons[0] if buttons else True)
         self.KeyDown += _key
 
+        # Pooled dialogs are hidden, never closed, so they can be shown again
+        def _closing(sender, e):
+            if self._pooled:
+                e.Cancel = True
+                self.Hide()
+        self.Closing += _closing
+
     def _close(self, value):
         self._result = value
+        if self._pooled:
+            self.Hide()   # ends ShowDialog without tearing the window down
+            return
         try: self.DialogResult = True
         except: pass
         self.Close()
 
+    def _reset(self, title, body_text):
+        self.Title = self._title_tb.Text = str(title or "")
+        self._body_tb.Text = str(body_text or "")
+        self._result = None
+        # CenterScreen only applies on first show: re-centre for the new content
+        self.WindowStartupLocation = WindowStartupLocation.Manual
+        content = self.Content
+        content.Measure(Size(float("inf"), float("inf")))
+        d = content.DesiredSize
+        wa = SystemParameters.WorkArea
+        self.Left = wa.Left + max(0.0, (wa.Width - d.Width) / 2)
+        self.Top = wa.Top + max(0.0, (wa.Height - d.Height) / 2)
+
+# One hidden dialog per button set, re-shown with new text on later calls
+_DIALOG_POOL = {}
+
 def alert(msg, title="Message", buttons=("OK",)):
-    dlg = _AdaDialog(title, msg, list(buttons))
+    key = tuple(buttons)
+    dlg = _DIALOG_POOL.get(key)
+    if dlg is not None and dlg.IsVisible:
+        # Re-entrant call while the pooled one is on screen: don't touch it
+        dlg = _AdaDialog(title, msg, list(buttons))
+        dlg.ShowDialog()
+        return dlg._result
+    if dlg is not None:
+        try:
+            dlg._reset(title, msg)
+            dlg.ShowDialog()
+            return dlg._result
+        except InvalidOperationException:
+            _DIALOG_POOL.pop(key, None)   # stale window: rebuild below
+    dlg = _AdaDialog(title, msg, list(buttons), pooled=True)
+    _DIALOG_POOL[key] = dlg
     dlg.ShowDialog()
     return dlg._result
 
@@ -3,25 +3,32 @@
 # Public API: alert(msg, title="..."); ask_yes_no(msg, title="..."); input_box(title, label, default_text="")
 __ada_forms_version__ = "v6-rounded-2025-08-18"
 
-import clr # type: ignore
-clr.AddReference("PresentationCore")
-clr.AddReference("PresentationFramework")
-clr.AddReference("WindowsBase")
-
-from System import String  # type: ignore
+import operator
+try:
+    from ._ada_wpf_bootstrap import ensure_wpf
+except ImportError:
+    from _ada_wpf_bootstrap import ensure_wpf
+ensure_wpf()
+
+from System import InvalidOperationException, Object, Predicate, TimeSpan  # type: ignore
+from System.Collections.Generic import List  # type: ignore
 from System.Windows import (  # type: ignore
-    Window, WindowStartupLocation, Thickness, HorizontalAlignment, VerticalAlignment,
-    SizeToContent, WindowStyle, ResizeMode, TextWrapping, CornerRadius
+    Window, WindowStartupLocation, Thickness, SizeToContent, WindowStyle, ResizeMode,
+    Size, SystemParameters
 )
 from System.Windows.Controls import (  # type: ignore
-    Grid, RowDefinition, ColumnDefinition, TextBlock, Button, Border, StackPanel, TextBox, Orientation,
-    ListBox, ListBoxItem, ScrollViewer, SelectionMode, ScrollBarVisibility
+    TextBlock, Button, StackPanel, TextBox, Orientation,
+    ListBox, ScrollViewer, SelectionMode, ScrollBarVisibility,
+    VirtualizingPanel, VirtualizationMode, ScrollUnit
 )
 from System.Windows.Media import (  # type: ignore
     SolidColorBrush, LinearGradientBrush, GradientStop, GradientStopCollection,
-    Color, Colors
+    Color, Brushes
 )
 from System.Windows.Input import MouseButtonState, Key  # type: ignore
+from System.Windows.Threading import DispatcherTimer, DispatcherPriority  # type: ignore
+from System.Windows.Markup import XamlReader  # type: ignore
+from System.Windows.Data import CollectionViewSource  # type: ignore
 
 
 # ── ADa brand colors ─────────────────────────────────────────────────────
@@ -31,13 +38,88 @@ BG_DARK  = Color.FromRgb(0x1F, 0x23, 0x2B)
 FG_LIGHT = Color.FromRgb(0xE8, 0xEA, 0xED)
 
 
+def _frozen_brush(color):
+    br = SolidColorBrush(color)
+    br.Freeze()   # shareable across every dialog and button
+    return br
+
+_BR_BLUE  = _frozen_brush(ADA_BLUE)
+_BR_PINK  = _frozen_brush(ADA_PINK)
+_BR_BG    = _frozen_brush(BG_DARK)
+_BR_FG    = _frozen_brush(FG_LIGHT)
+
+# Optional soft drop shadow, shared by every dialog
+try:
+    from System.Windows.Media.Effects import DropShadowEffect  # type: ignore
+    _SHADOW = DropShadowEffect()
+    _SHADOW.BlurRadius = 20
+    _SHADOW.Opacity = 0.35
+    _SHADOW.Direction = 270
+    _SHADOW.ShadowDepth = 0
+    _SHADOW.Freeze()
+except Exception:
+    _SHADOW = None  # effect unavailable → continue without shadow
+
+# Thickness is a value type; build each once and copy on assignment
+_TH_ZERO  = Thickness(0)
+_TH_BTN   = Thickness(8, 0, 0, 0)
+_TH_LABEL = Thickness(0, 0, 0, 10)
+
+
+_HEADER_BRUSH = None
+
 def _grad_header():
-    gsc = GradientStopCollection()
-    gsc.Add(GradientStop(ADA_BLUE, 0.0))
-    gsc.Add(GradientStop(ADA_PINK, 1.0))
-    brush = LinearGradientBrush()
-    brush.GradientStops = gsc
-    return brush  # default is relative box; visually left→right with these stops
+    """Shared header gradient, built and frozen on first use."""
+    global _HEADER_BRUSH
+    if _HEADER_BRUSH is None:
+        gsc = GradientStopCollection()
+        gsc.Add(GradientStop(ADA_BLUE, 0.0))
+        gsc.Add(GradientStop(ADA_PINK, 1.0))
+        brush = LinearGradientBrush()
+        brush.GradientStops = gsc  # default is relative box; visually left→right with these stops
+        brush.Freeze()
+        _HEADER_BRUSH = brush
+    return _HEADER_BRUSH
+
+
+def _hex(c):
+    return "#{:02X}{:02X}{:02X}".format(c.R, c.G, c.B)
+
+
+# Card layout: rounded shell → header (title + ✕) / body / footer (button panel).
+# Named nodes are filled in by _AdaDialog; the header gradient is set in code.
+_DIALOG_XAML = u"""
+<Border xmlns="http://schemas.microsoft.com/winfx/2006/xaml/presentation"
+        xmlns:x="http://schemas.microsoft.com/winfx/2006/xaml"
+        CornerRadius="12" Background="{bg}" SnapsToDevicePixels="True" Padding="0">
+  <Grid>
+    <Grid.RowDefinitions><RowDefinition/><RowDefinition/><RowDefinition/></Grid.RowDefinitions>
+    <Border x:Name="HeaderBorder" Grid.Row="0" CornerRadius="12,12,0,0">
+      <Grid>
+        <Grid.ColumnDefinitions><ColumnDefinition/><ColumnDefinition/></Grid.ColumnDefinitions>
+        <TextBlock x:Name="TitleText" Margin="20,14,20,14" Foreground="{fg}" FontSize="22"
+                   VerticalAlignment="Center"/>
+        <Button x:Name="CloseButton" Grid.Column="1" Content="&#x2715;" Width="36" Height="28"
+                Margin="0,10,10,10" HorizontalAlignment="Right" VerticalAlignment="Center"
+                Background="{pink}" Foreground="White" BorderThickness="0"/>
+      </Grid>
+    </Border>
+    <Border x:Name="BodyHost" Grid.Row="1" Margin="24,20,24,0" Background="{bg}">
+      <TextBlock x:Name="BodyText" TextWrapping="Wrap" Foreground="{fg}" FontSize="16"/>
+    </Border>
+    <Border Grid.Row="2" Margin="24,18,24,20" Background="{bg}" CornerRadius="0,0,12,12">
+      <StackPanel x:Name="ButtonPanel" Orientation="Horizontal" HorizontalAlignment="Right"/>
+    </Border>
+  </Grid>
+</Border>
+""".format(bg=_hex(BG_DARK), fg=_hex(FG_LIGHT), pink=_hex(ADA_PINK))
+
+
+def _add_children(panel, kids):
+    """Append kids to panel.Children with the Add method bound once."""
+    add = panel.Children.Add
+    for k in kids:
+        add(k)
 
 
 def _ws_none():
@@ -54,8 +136,9 @@ def _ws_none():
 class _AdaDialog(Window):
     """Skinnable dialog with rounded corners, gradient header, and soft shadow."""
 
-    def __init__(self, title_text, body_text, buttons):
+    def __init__(self, title_text, body_text, buttons, pooled=False):
         Window.__init__(self)
+        self._pooled = pooled
 
         # ── Remove OS chrome, allow transparency so rounded corners cut through ──
         self.WindowStyle = _ws_none()
@@ -64,74 +147,33 @@ class _AdaDialog(Window):
         self.ShowInTaskbar = False
         self.Title = ""
         # The *window* background must be transparent; the outer border will paint the card
-        from System.Windows.Media import Colors as _Colors #type:ignore
-        self.Background = SolidColorBrush(_Colors.Transparent)
+        self.Background = Brushes.Transparent
 
         # Window behavior
         self.SizeToContent = SizeToContent.WidthAndHeight
         self.WindowStartupLocation = WindowStartupLocation.CenterScreen
-        self.Padding = Thickness(0)
+        self.Padding = _TH_ZERO
         self._result = None
 
-        # ── Outer rounded shell (defines visible shape & background) ────────────
-        outer = Border()
-        outer.CornerRadius = CornerRadius(12)
-        outer.Background = SolidColorBrush(BG_DARK)
-        outer.SnapsToDevicePixels = True
-        outer.Padding = Thickness(0)
-
-        # Optional soft drop shadow
-        try:
-            from System.Windows.Media.Effects import DropShadowEffect  # type: ignore
-            shadow = DropShadowEffect()
-            shadow.BlurRadius = 20
-            shadow.Opacity = 0.35
-            shadow.Direction = 270
-            shadow.ShadowDepth = 0
-            outer.Effect = shadow
-        except Exception:
-            pass  # effect unavailable → continue without shadow
-
-        # ── Root grid inside the rounded shell ──────────────────────────────────
-        root = Grid()
-        root.RowDefinitions.Add(RowDefinition())  # header
-        root.RowDefinitions.Add(RowDefinition())  # body
-        root.RowDefinitions.Add(RowDefinition())  # footer
-        outer.Child = root
+        # ── Visual tree: parsed from XAML in one call, then the live nodes looked up ──
+        outer = XamlReader.Parse(_DIALOG_XAML)
         self.Content = outer
-
-        # ── Header (rounded top only) ───────────────────────────────────────────
-        header = Border()
+        header = outer.FindName("HeaderBorder")
         header.Background = _grad_header()
-        header.CornerRadius = CornerRadius(12, 12, 0, 0)
-        Grid.SetRow(header, 0)
-        headerGrid = Grid()
-        headerGrid.ColumnDefinitions.Add(ColumnDefinition())  # title
-        headerGrid.ColumnDefinitions.Add(ColumnDefinition())  # close
-        header.Child = headerGrid
-        root.Children.Add(header)
-
-        title_tb = TextBlock()
+        title_tb = outer.FindName("TitleText")
         title_tb.Text = str(title_text or "")
-        title_tb.Margin = Thickness(20, 14, 20, 14)
-        title_tb.Foreground = SolidColorBrush(FG_LIGHT)
-        title_tb.FontSize = 22
-        title_tb.VerticalAlignment = VerticalAlignment.Center
-        headerGrid.Children.Add(title_tb)
-
-        btn_close = Button()
-        btn_close.Content = "✕"
-        btn_close.Width = 36
-        btn_close.Height = 28
-        btn_close.Margin = Thickness(0, 10, 10, 10)
-        btn_close.HorizontalAlignment = HorizontalAlignment.Right
-        btn_close.VerticalAlignment = VerticalAlignment.Center
-        btn_close.Background = SolidColorBrush(ADA_PINK)
-        btn_close.Foreground = SolidColorBrush(Colors.White)
-        btn_close.BorderThickness = Thickness(0)
-        btn_close.Click += lambda s, e: self._close(False)
-        Grid.SetColumn(btn_close, 1)
-        headerGrid.Children.Add(btn_close)
+        body_tb = outer.FindName("BodyText")
+        body_tb.Text = str(body_text or "")
+        btn_panel = outer.FindName("ButtonPanel")
+        # Keep the live nodes so helpers don't walk Content/Child/Children
+        self._title_tb = title_tb
+        self._body_border = outer.FindName("BodyHost")
+        self._body_tb = body_tb
+
+        if _SHADOW is not None:
+            outer.Effect = _SHADOW
+
+        outer.FindName("CloseButton").Click += lambda s, e: self._close(False)
 
         # Drag window by header
         def _drag(sender, e):
@@ -142,57 +184,40 @@ class _AdaDialog(Window):
                     pass
         header.MouseLeftButtonDown += _drag
 
-        # ── Body ────────────────────────────────────────────────────────────────
-        body_border = Border()
-        body_border.Margin = Thickness(24, 20, 24, 0)
-        body_border.Background = SolidColorBrush(BG_DARK)
-        Grid.SetRow(body_border, 1)
-        root.Children.Add(body_border)
-
-        body_tb = TextBlock()
-        body_tb.Text = str(body_text or "")
-        body_tb.TextWrapping = TextWrapping.Wrap
-        body_tb.Foreground = SolidColorBrush(FG_LIGHT)
-        body_tb.FontSize = 16
-        body_border.Child = body_tb
-
-        # ── Footer (rounded bottom only) ───────────────────────────────────────
-        btn_row = Border()
-        btn_row.Margin = Thickness(24, 18, 24, 20)
-        btn_row.Background = SolidColorBrush(BG_DARK)
-        btn_row.CornerRadius = CornerRadius(0, 0, 12, 12)
-        Grid.SetRow(btn_row, 2)
-        root.Children.Add(btn_row)
-
-        btn_panel = StackPanel()
-        btn_panel.Orientation = Orientation.Horizontal
-        btn_panel.HorizontalAlignment = HorizontalAlignment.Right
-        btn_row.Child = btn_panel
-
         def make_btn(label, is_primary=False):
             b = Button()
-            b.Content = String(label)
+            b.Content = label   # pythonnet marshals str → System.String
+            b.Tag = label
             b.Width = 130
             b.Height = 36
-            b.Margin = Thickness(8, 0, 0, 0)
-            b.BorderThickness = Thickness(0)
-            b.Background = SolidColorBrush(ADA_BLUE if is_primary else ADA_PINK)
-            b.Foreground = SolidColorBrush(Colors.White)
+            b.Margin = _TH_BTN
+            b.BorderThickness = _TH_ZERO
+            b.Background = _BR_BLUE if is_primary else _BR_PINK
+            b.Foreground = Brushes.White
             return b
 
-        for i, lab in enumerate(buttons or ("OK",)):
-            b = make_btn(lab, is_primary=(i == 0))
-            b.Click += (lambda s, e, lab=lab: self._close(lab))
-            btn_panel.Children.Add(b)
+        labels = tuple(buttons or ("OK",))
+        btns = [make_btn(lab, is_primary=(i == 0)) for i, lab in enumerate(labels)]
+        _click = lambda s, e: self._close(s.Tag)  # one handler; label rides on Tag
+        for b in btns:
+            b.Click += _click
+        _add_children(btn_panel, btns)
 
         # Keyboard shortcuts
         def _key(sender, e):
             if e.Key == Key.Escape:
                 self._close(False)
             elif e.Key == Key.Enter:
-                self._close((buttons or ("OK",))[0])
+                self._close(labels[0])
         self.KeyDown += _key
 
+        # Pooled dialogs are hidden, never closed, so they can be shown again
+        def _closing(sender, e):
+            if self._pooled:
+                e.Cancel = True
+                self.Hide()
+        self.Closing += _closing
+
         try:
             self.Margin = Thickness(8)
         except Exception:
@@ -200,18 +225,52 @@ class _AdaDialog(Window):
 
     def _close(self, value):
         self._result = value
+        if self._pooled:
+            self.Hide()   # ends ShowDialog without tearing the window down
+            return
         try:
             self.DialogResult = True
         except:
             pass
         self.Close()
 
+    def _reset(self, title_text, body_text):
+        self._title_tb.Text = str(title_text or "")
+        self._body_tb.Text = str(body_text or "")
+        self._result = None
+        # CenterScreen only applies on first show: re-centre for the new content
+        self.WindowStartupLocation = WindowStartupLocation.Manual
+        content = self.Content
+        content.Measure(Size(float("inf"), float("inf")))
+        d = content.DesiredSize
+        wa = SystemParameters.WorkArea
+        self.Left = wa.Left + max(0.0, (wa.Width - d.Width) / 2)
+        self.Top = wa.Top + max(0.0, (wa.Height - d.Height) / 2)
+
 
 # ── Public helpers ───────────────────────────────────────────────────────
 
+# One hidden dialog per button set, re-shown with new text on later calls
+_DIALOG_POOL = {}
+
 def alert(msg, title="Message", buttons=("OK",)):
     """Show a simple message dialog. Returns the clicked label or False if closed with ESC/✕."""
-    dlg = _AdaDialog(title, msg, list(buttons))
+    key = tuple(buttons)
+    dlg = _DIALOG_POOL.get(key)
+    if dlg is not None and dlg.IsVisible:
+        # Re-entrant call while the pooled one is on screen: don't touch it
+        dlg = _AdaDialog(title, msg, list(buttons))
+        dlg.ShowDialog()
+        return dlg._result
+    if dlg is not None:
+        try:
+            dlg._reset(title, msg)
+            dlg.ShowDialog()
+            return dlg._result
+        except InvalidOperationException:
+            _DIALOG_POOL.pop(key, None)   # stale window: rebuild below
+    dlg = _AdaDialog(title, msg, list(buttons), pooled=True)
+    _DIALOG_POOL[key] = dlg
     dlg.ShowDialog()
     return dlg._result
 
@@ -227,23 +286,21 @@ def input_box(title, label, default_text=""):
     dlg = _AdaDialog(title, "", ["OK", "Cancel"])
 
     # Replace the body with label + textbox stack
-    body_border = dlg.Content.Child.Children[1] if hasattr(dlg.Content, "Child") else dlg.Content.Children[1]
     sp = StackPanel()
     sp.Orientation = Orientation.Vertical
-    body_border.Child = sp
 
     lbl = TextBlock()
     lbl.Text = str(label or "")
-    lbl.Foreground = SolidColorBrush(FG_LIGHT)
+    lbl.Foreground = _BR_FG
     lbl.FontSize = 16
-    lbl.Margin = Thickness(0, 0, 0, 10)
-    sp.Children.Add(lbl)
+    lbl.Margin = _TH_LABEL
 
     tb = TextBox()
     tb.Text = str(default_text or "")
     tb.FontSize = 16
     tb.Height = 34
-    sp.Children.Add(tb)
+    _add_children(sp, (lbl, tb))
+    dlg._body_border.Child = sp   # attach once, fully built
 
     # Enter = OK when focus in textbox
     def _tb_key(sender, e):
@@ -259,6 +316,19 @@ def input_box(title, label, default_text=""):
     dlg.ShowDialog()
     return (dlg._result == "OK", tb.Text if dlg._result == "OK" else None)
 
+class _Row(object):
+    """select_from_list entry; the ListBox shows str(row)."""
+    __slots__ = ("Display", "Obj", "_lower")
+
+    def __init__(self, display, obj):
+        self.Display = display
+        self.Obj = obj
+        self._lower = display.lower()   # filter key, computed once
+
+    def __str__(self):
+        return self.Display
+
+
 def select_from_list(
     items,
     title="Select",
@@ -280,49 +350,55 @@ def select_from_list(
     """
     dlg = _AdaDialog(title, "", [ok_label, cancel_label])
 
-    outer_border = dlg.Content
-    root_grid = outer_border.Child
-    body_border = root_grid.Children[1]
-
     container = StackPanel()
     container.Orientation = Orientation.Vertical
-    body_border.Child = container
+    kids = []
 
     if prompt:
         lbl = TextBlock()
         lbl.Text = str(prompt)
-        lbl.Foreground = SolidColorBrush(FG_LIGHT)
+        lbl.Foreground = _BR_FG
         lbl.FontSize = 16
-        lbl.Margin = Thickness(0, 0, 0, 10)
-        container.Children.Add(lbl)
+        lbl.Margin = _TH_LABEL
+        kids.append(lbl)
 
     # Filter box
     filter_tb = TextBox()
     filter_tb.FontSize = 15
     filter_tb.Height = 30
     filter_tb.Margin = Thickness(0, 0, 0, 8)
-    container.Children.Add(filter_tb)
+    kids.append(filter_tb)
 
     # List region: only use a scroller when item count is large
     use_scroll = len(items or []) > 8
 
     lb = ListBox()
     lb.SelectionMode = SelectionMode.Multiple if multiselect else SelectionMode.Single
-    lb.BorderThickness = Thickness(0)
+    lb.BorderThickness = _TH_ZERO
     lb.MinWidth = 560
 
+    # Only realize visible rows, recycling containers while scrolling
+    VirtualizingPanel.SetIsVirtualizing(lb, True)
+    VirtualizingPanel.SetVirtualizationMode(lb, VirtualizationMode.Recycling)
+    VirtualizingPanel.SetScrollUnit(lb, ScrollUnit.Pixel)
+
     if use_scroll:
-        list_scroller = ScrollViewer()
-        list_scroller.Height = 320
-        list_scroller.VerticalScrollBarVisibility = getattr(ScrollBarVisibility, "Auto")
-        list_scroller.HorizontalScrollBarVisibility = getattr(ScrollBarVisibility, "Disabled")
-        list_scroller.Content = lb
-        container.Children.Add(list_scroller)
+        # The ListBox's own ScrollViewer (wrapping it in another would give it
+        # infinite height and defeat virtualization)
+        lb.Height = 320
+        ScrollViewer.SetVerticalScrollBarVisibility(lb, getattr(ScrollBarVisibility, "Auto"))
+        ScrollViewer.SetHorizontalScrollBarVisibility(lb, getattr(ScrollBarVisibility, "Disabled"))
+        ScrollViewer.SetIsDeferredScrollingEnabled(lb, True)
     else:
         # let the list size naturally for shorter sets
         lb.MinHeight = 120
         lb.MaxHeight = 260
-        container.Children.Add(lb)
+    kids.append(lb)
+    _add_children(container, kids)
+    dlg._body_border.Child = container   # attach once, fully built
+
+    # Choose the display path once; one attrgetter call replaces hasattr+getattr
+    get_name = operator.attrgetter(name_attr) if name_attr else None
 
     def _display(o):
         if to_str:
@@ -330,29 +406,42 @@ def select_from_list(
                 return str(to_str(o))
             except Exception:
                 pass
-        if name_attr and hasattr(o, name_attr):
+        if get_name is not None:
             try:
-                return str(getattr(o, name_attr))
+                return str(get_name(o))
             except Exception:
                 pass
         return str(o)
 
-    full = [(_display(o), o) for o in (items or [])]
+    if not to_str and get_name is None:
+        _display = str
+
+    # Display text is built here, on the UI thread: to_str/name_attr may touch
+    # the Revit API, which isn't thread-safe
+    rows = List[Object]()
+    add = rows.Add
+    for o in (items or []):
+        add(_Row(_display(o), o))
+    view = CollectionViewSource.GetDefaultView(rows)
+    lb.ItemsSource = view
 
     def _reload(filter_text=""):
-        lb.Items.Clear()
+        # Filtering hides rows in the view; no ListBoxItems are rebuilt
         ft = (filter_text or "").lower()
-        for text, obj in full:
-            if not ft or ft in text.lower():
-                it = ListBoxItem()
-                it.Content = text
-                it.Tag = obj
-                lb.Items.Add(it)
+        view.Filter = Predicate[Object](lambda r: ft in r._lower) if ft else None
 
-    _reload()
+    # Debounce typing: re-filter once the keystrokes pause for 120 ms
+    filter_timer = DispatcherTimer(DispatcherPriority.Background)
+    filter_timer.Interval = TimeSpan.FromMilliseconds(120)
 
-    def _on_filter(sender, e):
+    def _on_filter_tick(sender, e):
+        filter_timer.Stop()
         _reload(filter_tb.Text)
+    filter_timer.Tick += _on_filter_tick
+
+    def _on_filter(sender, e):
+        filter_timer.Stop()
+        filter_timer.Start()
     filter_tb.TextChanged += _on_filter
 
     def _on_double_click(sender, e):
@@ -369,19 +458,20 @@ def select_from_list(
     dlg.Loaded += _loaded
 
     dlg.ShowDialog()
+    filter_timer.Stop()
 
     if dlg._result == ok_label:
         if multiselect:
             sel = []
             for it in lb.SelectedItems:
                 try:
-                    sel.append(it.Tag)
+                    sel.append(it.Obj)
                 except Exception:
                     pass
             return sel
         else:
             it = lb.SelectedItem
-            return it.Tag if it is not None else None
+            return it.Obj if it is not None else None
     else:
         return [] if multiselect else None
 
@@ -23,6 +23,8 @@ alert(message, title="Message") -> None
 
 from __future__ import annotations
 
+import importlib.util
+from types import SimpleNamespace
 from typing import Iterable, List, Optional
 
 
@@ -30,38 +32,284 @@ from typing import Iterable, List, Optional
 # Utilities
 # ─────────────────────────────────────────────────────────────────────────────
 def _as_list(options: Iterable) -> List[str]:
-    return [str(o) for o in (options or [])]
+    # str items pass through untouched; only non-str items pay for str()
+    return [o if type(o) is str else str(o) for o in (options or [])]
+
+
+_UNSET = object()
+_ui6_cache = _UNSET
+
+
+def _ui6():
+    """Return ada_brandforms_v6, importing it at most once per process (None if unavailable)."""
+    global _ui6_cache
+    if _ui6_cache is _UNSET:
+        try:
+            import ada_brandforms_v6 as ui6  # type: ignore
+            _ui6_cache = ui6
+        except Exception:
+            _ui6_cache = None
+    return _ui6_cache
+
+
+def _has_module(name: str) -> bool:
+    """True if `name` is importable, decided from its spec (nothing is imported)."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except Exception:
+        return False
+
+
+# Optional back-ends, probed on first use (after ada_bootstrap has set sys.path)
+# so the fallback chains branch instead of raising
+_HAS_PYREVIT = None
+_task_dialog_cache = _UNSET
+
+
+def _has_pyrevit() -> bool:
+    global _HAS_PYREVIT
+    if _HAS_PYREVIT is None:
+        _HAS_PYREVIT = _has_module("pyrevit")
+    return _HAS_PYREVIT
+
+
+def _task_dialog():
+    """Revit's TaskDialog class, imported at most once (None outside Revit)."""
+    global _task_dialog_cache
+    if _task_dialog_cache is _UNSET:
+        try:
+            from Autodesk.Revit.UI import TaskDialog  # type: ignore
+            _task_dialog_cache = TaskDialog
+        except Exception:
+            _task_dialog_cache = None
+    return _task_dialog_cache
+
+
+_UI_MODE = None
+
+
+def _ui_mode() -> str:
+    """Best available dialog back-end, probed once: ui6 / pyrevit / revit_td / console."""
+    global _UI_MODE
+    if _UI_MODE is None:
+        if _ui6() is not None:
+            _UI_MODE = "ui6"
+        elif _has_pyrevit():
+            _UI_MODE = "pyrevit"
+        elif _task_dialog() is not None:
+            _UI_MODE = "revit_td"
+        else:
+            _UI_MODE = "console"
+    return _UI_MODE
+
+
+_WPF = None
+
+
+def _get_wpf():
+    """WPF types for the fallback dialogs, loaded and resolved once per process."""
+    global _WPF
+    if _WPF is None:
+        try:
+            from ._ada_wpf_bootstrap import ensure_wpf
+        except ImportError:
+            from _ada_wpf_bootstrap import ensure_wpf
+        ensure_wpf()
+
+        from System.Windows import ( #type: ignore
+            Window, WindowStartupLocation, WindowStyle, Thickness, CornerRadius,
+            SizeToContent, ResizeMode, HorizontalAlignment, VerticalAlignment
+        )
+        from System.Windows.Controls import ( #type: ignore
+            Grid, RowDefinition, ColumnDefinition, TextBlock,
+            Button, Border, StackPanel, ScrollViewer,
+            CheckBox, Orientation
+        )
+        from System.Windows.Media import ( #type: ignore
+            SolidColorBrush, LinearGradientBrush,
+            GradientStop, GradientStopCollection, Color
+        )
+        _WPF = SimpleNamespace(
+            Window=Window, WindowStartupLocation=WindowStartupLocation,
+            WindowStyle=WindowStyle, Thickness=Thickness, CornerRadius=CornerRadius,
+            SizeToContent=SizeToContent, ResizeMode=ResizeMode,
+            HorizontalAlignment=HorizontalAlignment, VerticalAlignment=VerticalAlignment,
+            Grid=Grid, RowDefinition=RowDefinition, ColumnDefinition=ColumnDefinition,
+            TextBlock=TextBlock, Button=Button, Border=Border, StackPanel=StackPanel,
+            ScrollViewer=ScrollViewer, CheckBox=CheckBox, Orientation=Orientation,
+            SolidColorBrush=SolidColorBrush, LinearGradientBrush=LinearGradientBrush,
+            GradientStop=GradientStop, GradientStopCollection=GradientStopCollection,
+            Color=Color,
+        )
+        # Thickness/CornerRadius are value types: build the shared ones once
+        _WPF.T0 = Thickness(0)
+        _WPF.T_TITLE = Thickness(20, 14, 20, 14)
+        _WPF.T_CLOSE = Thickness(0, 10, 10, 10)
+        _WPF.T_BODY = Thickness(24, 20, 24, 24)
+        _WPF.T_MSG = Thickness(0, 0, 0, 10)
+        _WPF.T_BTN_PAD = Thickness(16, 8, 16, 8)
+        _WPF.T_BTN = Thickness(0, 6, 0, 6)
+        _WPF.T_MULTI_MSG = Thickness(24, 14, 24, 0)
+        _WPF.T_MULTI_BODY = Thickness(24, 14, 24, 14)
+        _WPF.T_CB = Thickness(4, 4, 4, 4)
+        _WPF.T_FOOT = Thickness(24, 0, 24, 18)
+        _WPF.T_FOOT_BTN_PAD = Thickness(14, 6, 14, 6)
+        _WPF.T_FOOT_BTN = Thickness(8, 0, 0, 0)
+        _WPF.CR12 = CornerRadius(12)
+        _WPF.CR12_TOP = CornerRadius(12, 12, 0, 0)
+    return _WPF
+
+
+_BRUSHES = None
+
+
+def _brushes(W, ui6=None):
+    """Frozen brand brushes shared by every fallback dialog (built once)."""
+    global _BRUSHES
+    if _BRUSHES is None:
+        if ui6 is not None:
+            ADA_BLUE = ui6.ADA_BLUE
+            ADA_PINK = ui6.ADA_PINK
+            BG_DARK = ui6.BG_DARK
+            FG_LIGHT = ui6.FG_LIGHT
+        else:
+            ADA_BLUE = W.Color.FromRgb(0x5C, 0x7C, 0xFA)
+            ADA_PINK = W.Color.FromRgb(0xF7, 0x59, 0xC0)
+            BG_DARK = W.Color.FromRgb(0x1F, 0x23, 0x2B)
+            FG_LIGHT = W.Color.FromRgb(0xE8, 0xEA, 0xED)
+
+        def solid(c):
+            br = W.SolidColorBrush(c)
+            br.Freeze()
+            return br
+
+        g = W.GradientStopCollection()
+        g.Add(W.GradientStop(ADA_BLUE, 0.0))
+        g.Add(W.GradientStop(ADA_PINK, 1.0))
+        header = W.LinearGradientBrush()
+        header.GradientStops = g
+        header.Freeze()
+
+        _BRUSHES = SimpleNamespace(
+            blue=solid(ADA_BLUE), pink=solid(ADA_PINK), bg=solid(BG_DARK),
+            fg=solid(FG_LIGHT), white=solid(W.Color.FromRgb(255, 255, 255)),
+            clear=solid(W.Color.FromArgb(0, 0, 0, 0)), header=header,
+        )
+    return _BRUSHES
+
+
+def _build_themed_window(W, title, rows, ui6=None):
+    """Frameless rounded window with gradient header, title and ✕ close button.
+
+    `rows` rows are added to the root grid; the header takes row 0 and callers
+    fill the rest. Returns (window, root_grid, brushes) — see _brushes().
+    """
+    B = _brushes(W, ui6)
+
+    w = W.Window()
+    try:
+        w.WindowStyle = getattr(W.WindowStyle, "None")
+    except Exception:
+        pass
+
+    w.ResizeMode = W.ResizeMode.NoResize
+    w.AllowsTransparency = True
+    w.ShowInTaskbar = False
+    w.Title = ""
+    w.Background = B.clear
+    w.SizeToContent = W.SizeToContent.WidthAndHeight
+    w.WindowStartupLocation = W.WindowStartupLocation.CenterScreen
+    w.Padding = W.T0
+
+    outer = W.Border()
+    outer.CornerRadius = W.CR12
+    outer.Background = B.bg
+    outer.Padding = W.T0
+    w.Content = outer
+
+    root = W.Grid()
+    outer.Child = root
+    for _ in range(rows):
+        root.RowDefinitions.Add(W.RowDefinition())
+
+    # Header
+    header = W.Border()
+    header.Background = B.header
+    header.CornerRadius = W.CR12_TOP
+    W.Grid.SetRow(header, 0)
+    root.Children.Add(header)
+
+    hg = W.Grid()
+    hg.ColumnDefinitions.Add(W.ColumnDefinition())
+    hg.ColumnDefinitions.Add(W.ColumnDefinition())
+    header.Child = hg
+
+    title_txt = W.TextBlock()
+    title_txt.Text = title
+    title_txt.Margin = W.T_TITLE
+    title_txt.Foreground = B.fg
+    title_txt.FontSize = 22
+    hg.Children.Add(title_txt)
+
+    btnX = W.Button()
+    btnX.Content = "✕"
+    btnX.Width = 36
+    btnX.Height = 28
+    btnX.Margin = W.T_CLOSE
+    btnX.HorizontalAlignment = W.HorizontalAlignment.Right
+    btnX.VerticalAlignment = W.VerticalAlignment.Center
+    btnX.Background = B.pink
+    btnX.Foreground = B.white
+    btnX.BorderThickness = W.T0
+
+    def _close(*_):
+        setattr(w, "DialogResult", False)
+        w.Close()
+
+    btnX.Click += _close
+    W.Grid.SetColumn(btnX, 1)
+    hg.Children.Add(btnX)
+
+    return w, root, B
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Theme-first alert
 # ─────────────────────────────────────────────────────────────────────────────
 def alert(message: str, title: str = "Message") -> None:
-    # Try ADa themed alerts
-    try:
-        import ada_brandforms_v6 as ui6  # type: ignore
-        ui6.alert(str(message), title=str(title))
+    # Headless (no UI back-end at all): straight to the console
+    if _ui_mode() == "console":
+        print("[ALERT] {}: {}".format(title, message))
         return
-    except Exception:
-        pass
+
+    # Try ADa themed alerts
+    ui6 = _ui6()
+    if ui6 is not None:
+        try:
+            ui6.alert(str(message), title=str(title))
+            return
+        except Exception:
+            pass
 
     # Fallback: pyrevit.forms
-    try:
-        from pyrevit import forms as _PF  # type: ignore
-        _PF.alert(str(message), title=str(title))
-        return
-    except Exception:
-        pass
+    if _has_pyrevit():
+        try:
+            from pyrevit import forms as _PF  # type: ignore
+            _PF.alert(str(message), title=str(title))
+            return
+        except Exception:
+            pass
 
     # Fallback: Revit TaskDialog
-    try:
-        from Autodesk.Revit.UI import TaskDialog  # type: ignore
-        td = TaskDialog(str(title))
-        td.MainInstruction = str(message)
-        td.Show()
-        return
-    except Exception:
-        pass
+    TaskDialog = _task_dialog()
+    if TaskDialog is not None:
+        try:
+            td = TaskDialog(str(title))
+            td.MainInstruction = str(message)
+            td.Show()
+            return
+        except Exception:
+            pass
 
     # Last resort: console
     print("[ALERT] {}: {}".format(title, message))
@@ -82,9 +330,9 @@ def choose(
         return None
 
     # Path 1: ADa themed, if available
+    ui6 = _ui6()
     try:
-        import ada_brandforms_v6 as ui6  # type: ignore
-        if hasattr(ui6, "big_buttons"):
+        if ui6 is not None and hasattr(ui6, "big_buttons"):
             rv = ui6.big_buttons(
                 title=title,
                 options=opts,
@@ -98,159 +346,64 @@ def choose(
 
     # Path 2: Lightweight WPF gradient window
     try:
-        import clr  # type: ignore
-        clr.AddReference("PresentationCore")
-        clr.AddReference("PresentationFramework")
-        clr.AddReference("WindowsBase")
-
-        from System.Windows import ( #type: ignore
-            Window, WindowStartupLocation, Thickness,
-            SizeToContent, ResizeMode, HorizontalAlignment,
-            VerticalAlignment
-        )
-        from System.Windows.Controls import ( #type: ignore
-            Grid, RowDefinition, ColumnDefinition, TextBlock,
-            Button, Border, StackPanel, ScrollViewer
-        )
-        from System.Windows.Media import ( #type: ignore
-            SolidColorBrush, LinearGradientBrush,
-            GradientStop, GradientStopCollection, Color
-        )
-        from System.Windows import CornerRadius #type: ignore
-
-        # Colors
-        try:
-            import ada_brandforms_v6 as ui6  # type: ignore
-            ADA_BLUE = ui6.ADA_BLUE
-            ADA_PINK = ui6.ADA_PINK
-            BG_DARK = ui6.BG_DARK
-            FG_LIGHT = ui6.FG_LIGHT
-        except Exception:
-            ADA_BLUE = Color.FromRgb(0x5C, 0x7C, 0xFA)
-            ADA_PINK = Color.FromRgb(0xF7, 0x59, 0xC0)
-            BG_DARK = Color.FromRgb(0x1F, 0x23, 0x2B)
-            FG_LIGHT = Color.FromRgb(0xE8, 0xEA, 0xED)
-
-        def grad_header():
-            g = GradientStopCollection()
-            g.Add(GradientStop(ADA_BLUE, 0.0))
-            g.Add(GradientStop(ADA_PINK, 1.0))
-            br = LinearGradientBrush()
-            br.GradientStops = g
-            return br
+        W = _get_wpf()
 
         choice = {"label": None}
-
-        w = Window()
-        try:
-            from System.Windows import WindowStyle #type: ignore
-            w.WindowStyle = getattr(WindowStyle, "None")
-        except Exception:
-            pass
-
-        w.ResizeMode = ResizeMode.NoResize
-        w.AllowsTransparency = True
-        w.ShowInTaskbar = False
-        w.Title = ""
-        w.Background = SolidColorBrush(Color.FromArgb(0, 0, 0, 0))
-        w.SizeToContent = SizeToContent.WidthAndHeight
-        w.WindowStartupLocation = WindowStartupLocation.CenterScreen
-        w.Padding = Thickness(0)
-
-        outer = Border()
-        outer.CornerRadius = CornerRadius(12)
-        outer.Background = SolidColorBrush(BG_DARK)
-        outer.Padding = Thickness(0)
-        w.Content = outer
-
-        root = Grid()
-        outer.Child = root
-        root.RowDefinitions.Add(RowDefinition())
-        root.RowDefinitions.Add(RowDefinition())
-
-        # Header
-        header = Border()
-        header.Background = grad_header()
-        header.CornerRadius = CornerRadius(12, 12, 0, 0)
-        Grid.SetRow(header, 0)
-        root.Children.Add(header)
-
-        hg = Grid()
-        hg.ColumnDefinitions.Add(ColumnDefinition())
-        hg.ColumnDefinitions.Add(ColumnDefinition())
-        header.Child = hg
-
-        title_txt = TextBlock()
-        title_txt.Text = title
-        title_txt.Margin = Thickness(20, 14, 20, 14)
-        title_txt.Foreground = SolidColorBrush(FG_LIGHT)
-        title_txt.FontSize = 22
-        hg.Children.Add(title_txt)
-
-        btnX = Button()
-        btnX.Content = "✕"
-        btnX.Width = 36
-        btnX.Height = 28
-        btnX.Margin = Thickness(0, 10, 10, 10)
-        btnX.HorizontalAlignment = HorizontalAlignment.Right
-        btnX.VerticalAlignment = VerticalAlignment.Center
-        btnX.Background = SolidColorBrush(ADA_PINK)
-        btnX.Foreground = SolidColorBrush(Color.FromRgb(255, 255, 255))
-        btnX.BorderThickness = Thickness(0)
-
-        def _close(*_):
-            setattr(w, "DialogResult", False)
-            w.Close()
-
-        btnX.Click += _close
-        Grid.SetColumn(btnX, 1)
-        hg.Children.Add(btnX)
+        w, root, B = _build_themed_window(W, title, 2, ui6)
 
         # Body
-        body = Border()
-        body.Margin = Thickness(24, 20, 24, 24)
-        Grid.SetRow(body, 1)
+        body = W.Border()
+        body.Margin = W.T_BODY
+        W.Grid.SetRow(body, 1)
         root.Children.Add(body)
 
-        use_scroll = len(opts) > 6
-
-        if use_scroll:
-            sc = ScrollViewer()
-            body.Child = sc
-            pnl = StackPanel()
-            sc.Content = pnl
-        else:
-            pnl = StackPanel()
-            body.Child = pnl
+        # Filled while detached; attached once below so layout runs once
+        pnl = W.StackPanel()
 
         if message:
-            txt = TextBlock()
+            txt = W.TextBlock()
             txt.Text = str(message)
-            txt.Margin = Thickness(0, 0, 0, 10)
-            txt.Foreground = SolidColorBrush(FG_LIGHT)
+            txt.Margin = W.T_MSG
+            txt.Foreground = B.fg
             pnl.Children.Add(txt)
 
+        # Shared per-button values, built once rather than per option
+        btn_pad = W.T_BTN_PAD
+        btn_margin = W.T_BTN
+        btn_border = W.T0
+        btn_bg = B.blue
+        btn_fg = B.white
+
+        # One handler for every option; the label rides on the button's Tag
+        def _click(sender, e):
+            choice["label"] = sender.Tag
+            setattr(w, "DialogResult", True)
+            w.Close()
+
         def mk(label):
-            b = Button()
+            b = W.Button()
             b.Content = label
             b.MinWidth = 260
-            b.Padding = Thickness(16, 8, 16, 8)
+            b.Padding = btn_pad
             b.Height = 40
-            b.Margin = Thickness(0, 6, 0, 6)
-            b.BorderThickness = Thickness(0)
-            b.Background = SolidColorBrush(ADA_BLUE)
-            b.Foreground = SolidColorBrush(Color.FromRgb(255, 255, 255))
-
-            def _click(*_):
-                choice["label"] = label
-                setattr(w, "DialogResult", True)
-                w.Close()
-
+            b.Margin = btn_margin
+            b.BorderThickness = btn_border
+            b.Background = btn_bg
+            b.Foreground = btn_fg
+            b.Tag = label
             b.Click += _click
             return b
 
+        add = pnl.Children.Add
         for label in opts:
-            pnl.Children.Add(mk(label))
+            add(mk(label))
+
+        if len(opts) > 6:
+            sc = W.ScrollViewer()
+            sc.Content = pnl
+            body.Child = sc
+        else:
+            body.Child = pnl
 
         ok = w.ShowDialog()
         if ok and choice["label"] in opts:
@@ -261,27 +414,29 @@ def choose(
         pass
 
     # Path 3: pyrevit.forms
-    try:
-        from pyrevit import forms as _PF  # type: ignore
-        rv = _PF.CommandSwitchWindow.show(
-            opts,
-            message=str(message),
-            title=str(title)
-        )
-        if isinstance(rv, (list, tuple)):
-            return rv[0] if rv and rv[0] in opts else default
-        return rv if rv in opts else default
-    except Exception:
-        pass
+    if _has_pyrevit():
+        try:
+            from pyrevit import forms as _PF  # type: ignore
+            rv = _PF.CommandSwitchWindow.show(
+                opts,
+                message=str(message),
+                title=str(title)
+            )
+            if isinstance(rv, (list, tuple)):
+                return rv[0] if rv and rv[0] in opts else default
+            return rv if rv in opts else default
+        except Exception:
+            pass
 
     # Path 4: Revit TaskDialog
-    try:
-        from Autodesk.Revit.UI import TaskDialog  # type: ignore
-        td = TaskDialog(str(title))
-        td.MainInstruction = str(message) + "\n\n" + "\n".join("- " + o for o in opts)
-        td.Show()
-    except Exception:
-        pass
+    TaskDialog = _task_dialog()
+    if TaskDialog is not None:
+        try:
+            td = TaskDialog(str(title))
+            td.MainInstruction = str(message) + "\n\n" + "\n".join("- " + o for o in opts)
+            td.Show()
+        except Exception:
+            pass
 
     return default
 
@@ -301,9 +456,9 @@ def choose_multi(
         return []
 
     # Path 1: ADa themed
+    ui6 = _ui6()
     try:
-        import ada_brandforms_v6 as ui6  # type: ignore
-        if hasattr(ui6, "big_buttons_multi"):
+        if ui6 is not None and hasattr(ui6, "big_buttons_multi"):
             rv = ui6.big_buttons_multi(
                 title=title,
                 options=opts,
@@ -321,171 +476,69 @@ def choose_multi(
 
     # Path 2: Lightweight WPF checkbox list
     try:
-        import clr  # type: ignore
-        clr.AddReference("PresentationCore")
-        clr.AddReference("PresentationFramework")
-        clr.AddReference("WindowsBase")
-
-        from System.Windows import ( #type: ignore
-            Window, WindowStartupLocation, Thickness,
-            SizeToContent, ResizeMode, HorizontalAlignment,
-            VerticalAlignment
-        )
-        from System.Windows.Controls import ( #type: ignore
-            Grid, RowDefinition, ColumnDefinition, TextBlock,
-            Button, Border, StackPanel, ScrollViewer,
-            CheckBox, Orientation
-        )
-        from System.Windows.Media import ( #type: ignore
-            SolidColorBrush, LinearGradientBrush,
-            GradientStop, GradientStopCollection, Color
-        )
-        from System.Windows import CornerRadius #type: ignore
-
-        try:
-            import ada_brandforms_v6 as ui6  # type: ignore
-            ADA_BLUE = ui6.ADA_BLUE
-            ADA_PINK = ui6.ADA_PINK
-            BG_DARK = ui6.BG_DARK
-            FG_LIGHT = ui6.FG_LIGHT
-        except Exception:
-            ADA_BLUE = Color.FromRgb(0x5C, 0x7C, 0xFA)
-            ADA_PINK = Color.FromRgb(0xF7, 0x59, 0xC0)
-            BG_DARK = Color.FromRgb(0x1F, 0x23, 0x2B)
-            FG_LIGHT = Color.FromRgb(0xE8, 0xEA, 0xED)
-
-        def grad_header():
-            g = GradientStopCollection()
-            g.Add(GradientStop(ADA_BLUE, 0.0))
-            g.Add(GradientStop(ADA_PINK, 1.0))
-            br = LinearGradientBrush()
-            br.GradientStops = g
-            return br
+        W = _get_wpf()
 
         chosen = {"labels": []}
-
-        w = Window()
-        try:
-            from System.Windows import WindowStyle #type: ignore
-            w.WindowStyle = getattr(WindowStyle, "None")
-        except Exception:
-            pass
-
-        w.ResizeMode = ResizeMode.NoResize
-        w.AllowsTransparency = True
-        w.ShowInTaskbar = False
-        w.Title = ""
-        w.Background = SolidColorBrush(Color.FromArgb(0, 0, 0, 0))
-        w.SizeToContent = SizeToContent.WidthAndHeight
-        w.WindowStartupLocation = WindowStartupLocation.CenterScreen
-        w.Padding = Thickness(0)
-
-        outer = Border()
-        outer.CornerRadius = CornerRadius(12)
-        outer.Background = SolidColorBrush(BG_DARK)
-        outer.Padding = Thickness(0)
-        w.Content = outer
-
-        root = Grid()
-        outer.Child = root
-
         # Rows: header / message / list / footer
-        root.RowDefinitions.Add(RowDefinition())
-        root.RowDefinitions.Add(RowDefinition())
-        root.RowDefinitions.Add(RowDefinition())
-        root.RowDefinitions.Add(RowDefinition())
-
-        # Header
-        header = Border()
-        header.Background = grad_header()
-        header.CornerRadius = CornerRadius(12, 12, 0, 0)
-        Grid.SetRow(header, 0)
-        root.Children.Add(header)
-
-        hg = Grid()
-        hg.ColumnDefinitions.Add(ColumnDefinition())
-        hg.ColumnDefinitions.Add(ColumnDefinition())
-        header.Child = hg
-
-        title_txt = TextBlock()
-        title_txt.Text = title
-        title_txt.Margin = Thickness(20, 14, 20, 14)
-        title_txt.Foreground = SolidColorBrush(FG_LIGHT)
-        title_txt.FontSize = 22
-        hg.Children.Add(title_txt)
-
-        btnX = Button()
-        btnX.Content = "✕"
-        btnX.Width = 36
-        btnX.Height = 28
-        btnX.Margin = Thickness(0, 10, 10, 10)
-        btnX.HorizontalAlignment = HorizontalAlignment.Right
-        btnX.VerticalAlignment = VerticalAlignment.Center
-        btnX.Background = SolidColorBrush(ADA_PINK)
-        btnX.Foreground = SolidColorBrush(Color.FromRgb(255, 255, 255))
-        btnX.BorderThickness = Thickness(0)
-
-        def _close(*_):
-            setattr(w, "DialogResult", False)
-            w.Close()
-
-        btnX.Click += _close
-        Grid.SetColumn(btnX, 1)
-        hg.Children.Add(btnX)
+        w, root, B = _build_themed_window(W, title, 4, ui6)
 
         # Message
-        msg_border = Border()
-        msg_border.Margin = Thickness(24, 14, 24, 0)
-        Grid.SetRow(msg_border, 1)
+        msg_border = W.Border()
+        msg_border.Margin = W.T_MULTI_MSG
+        W.Grid.SetRow(msg_border, 1)
         root.Children.Add(msg_border)
 
-        msg_txt = TextBlock()
+        msg_txt = W.TextBlock()
         msg_txt.Text = str(message or "")
-        msg_txt.Foreground = SolidColorBrush(FG_LIGHT)
+        msg_txt.Foreground = B.fg
         msg_border.Child = msg_txt
 
         # Body list
-        body = Border()
-        body.Margin = Thickness(24, 14, 24, 14)
-        Grid.SetRow(body, 2)
+        body = W.Border()
+        body.Margin = W.T_MULTI_BODY
+        W.Grid.SetRow(body, 2)
         root.Children.Add(body)
 
-        sc = ScrollViewer()
-        body.Child = sc
-
-        pnl = StackPanel()
-        sc.Content = pnl
+        # Filled while detached; attached once below so layout runs once
+        pnl = W.StackPanel()
+        add = pnl.Children.Add
 
-        boxes = []
+        boxes = []  # (checkbox, label) — label kept so OK only reads IsChecked
+        cb_margin = W.T_CB
+        cb_fg = B.fg
         for label in opts:
-            cb = CheckBox()
+            cb = W.CheckBox()
             cb.Content = label
             cb.IsChecked = False
-            cb.Margin = Thickness(4, 4, 4, 4)
-            cb.Foreground = SolidColorBrush(FG_LIGHT)
-            pnl.Children.Add(cb)
-            boxes.append(cb)
+            cb.Margin = cb_margin
+            cb.Foreground = cb_fg
+            add(cb)
+            boxes.append((cb, label))
+
+        sc = W.ScrollViewer()
+        sc.Content = pnl
+        body.Child = sc
 
         # Footer
-        foot = Border()
-        foot.Margin = Thickness(24, 0, 24, 18)
-        Grid.SetRow(foot, 3)
+        foot = W.Border()
+        foot.Margin = W.T_FOOT
+        W.Grid.SetRow(foot, 3)
         root.Children.Add(foot)
 
-        fb = StackPanel()
-        fb.Orientation = Orientation.Horizontal
+        fb = W.StackPanel()
+        fb.Orientation = W.Orientation.Horizontal
         foot.Child = fb
 
         def mk(label, primary=False):
-            b = Button()
+            b = W.Button()
             b.Content = label
             b.MinWidth = 120
-            b.Padding = Thickness(14, 6, 14, 6)
+            b.Padding = W.T_FOOT_BTN_PAD
             b.Height = 34
-            b.Margin = Thickness(8, 0, 0, 0)
-            b.BorderThickness = Thickness(0)
-            b.Background = SolidColorBrush(ADA_BLUE if primary else ADA_PINK)
-            b.Foreground = SolidColorBrush(Color.FromRgb(255, 255, 255))
+            b.Margin = W.T_FOOT_BTN
+            b.BorderThickness = W.T0
+            b.Background = B.blue if primary else B.pink
+            b.Foreground = B.white
             return b
 
         if include_all:
@@ -493,7 +546,7 @@ def choose_multi(
             fb.Children.Add(bAll)
 
             def _all(*_):
-                for cb in boxes:
+                for cb, _ in boxes:
                     cb.IsChecked = True
 
             bAll.Click += _all
@@ -502,7 +555,7 @@ def choose_multi(
         fb.Children.Add(bNone)
 
         def _none(*_):
-            for cb in boxes:
+            for cb, _ in boxes:
                 cb.IsChecked = False
 
         bNone.Click += _none
@@ -511,11 +564,7 @@ def choose_multi(
         fb.Children.Add(bGo)
 
         def _go(*_):
-            chosen["labels"] = [
-                str(cb.Content)
-                for cb in boxes
-                if bool(getattr(cb, "IsChecked", False))
-            ]
+            chosen["labels"] = [label for cb, label in boxes if cb.IsChecked]
             setattr(w, "DialogResult", True)
             w.Close()
 
@@ -533,20 +582,21 @@ def choose_multi(
             pass
 
     # Path 3: pyrevit fallback
-    try:
-        from pyrevit import forms as _PF  # type: ignore
-        rv = _PF.CommandSwitchWindow.show(
-            opts,
-            message=str(message),
-            title=str(title)
-        )
-        if rv == "All" and include_all:
-            return list(opts)
-        if isinstance(rv, (list, tuple)):
-            rv = rv[0] if rv else None
-        return [rv] if rv in opts else []
-    except Exception:
-        pass
+    if _has_pyrevit():
+        try:
+            from pyrevit import forms as _PF  # type: ignore
+            rv = _PF.CommandSwitchWindow.show(
+                opts,
+                message=str(message),
+                title=str(title)
+            )
+            if rv == "All" and include_all:
+                return list(opts)
+            if isinstance(rv, (list, tuple)):
+                rv = rv[0] if rv else None
+            return [rv] if rv in opts else []
+        except Exception:
+            pass
 
     alert("Multi-select UI not available in this environment.", title)
     return []
\ No newline at end of file
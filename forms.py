@@ -1,16 +1,54 @@
 # ada_ui/forms.py — legacy shim so "from ada_ui import forms" works
+# The brandforms module (and with it pythonnet/WPF) is imported on first
+# attribute access, not when this shim is imported.
+import sys
 from importlib import import_module
 
 _candidates = ("ada_brandforms_v6", "ada_brandforms_v5", "ada_brandforms_v4_2",
                "ada_brandforms_v4", "ada_brandforms_v3")
 
-for name in _candidates:
-    try:
-        _m = import_module("." + name, __package__)
+_resolved = False
+_error = None   # ImportError from a failed resolve, kept so it runs only once
+
+
+def _resolve():
+    global _resolved, _error, __all__
+    if _resolved:
+        return
+    _resolved = True
+    failures = []
+    for name in _candidates:
+        try:
+            _m = import_module("." + name, __package__)
+        except Exception as ex:
+            failures.append("{}: {}".format(name, ex))
+            continue
         # re-export everything public from the chosen brandforms module
-        globals().update({k: v for k, v in vars(_m).items() if not k.startswith("_")})
-        break
+        public = {k: v for k, v in vars(_m).items() if not k.startswith("_")}
+        globals().update(public)
+        __all__ = sorted(public)   # star-imports read __all__, not __dir__
+        return
+    _error = ImportError("No ADa brandforms module found under ada_ui ({}).".format(
+        "; ".join(failures)))
+    print("[ADa] forms:", _error, file=sys.stderr)   # reported once; re-raised on use
+
+
+def __getattr__(name):
+    # PEP 562: only called for names not yet in globals()
+    if name == "__all__" or not name.startswith("_"):
+        _resolve()
+        if name in globals():
+            return globals()[name]
+        if _error is not None:
+            # Not an AttributeError, so getattr(..., default)/hasattr probes in
+            # alerts/inputs/pickers fail loudly instead of silently doing nothing
+            raise _error
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    try:
+        _resolve()
     except Exception:
-        continue
-else:
-    raise ImportError("No ADa brandforms module found under ada_ui.")
\ No newline at end of file
+        pass
+    return sorted(globals())
@@ -0,0 +1,36 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ada_brand_bulk_editor_shim as shim  # noqa: E402
+
+
+class BulkEditDuplicateLabelsTest(unittest.TestCase):
+    def test_every_row_with_a_shared_label_stays_reachable(self):
+        params = [
+            {"name": "A", "display_name": "Flag", "type": "bool", "value": True},
+            {"name": "B", "display_name": "Flag", "type": "bool", "value": True},
+        ]
+        dup_label = shim._render_row({"display": "Flag", "ptype": "bool", "cur": True,
+                                      "unit": "", "new": None})
+        # pick the shared label and set it; pick it again (now row B) and set it; apply
+        answers = iter([dup_label, "Yes", dup_label, "No", "Apply / Done"])
+        seen = []
+
+        def fake_sfl(items, **kwargs):
+            seen.append(list(items))
+            return next(answers)
+
+        with mock.patch.object(shim, "_sfl", fake_sfl):
+            result = shim.bulk_edit(params)
+
+        self.assertEqual(result, {"A": True, "B": False})
+        self.assertEqual(seen[0].count(dup_label), 2)
+        self.assertEqual(seen[2].count(dup_label), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()